@@ -20,19 +20,35 @@ import threading
 import subprocess
 import queue
 import shutil
-import traceback
 from pathlib import Path
 from datetime import datetime
-from functools import lru_cache
-from typing import Optional, Dict, List, Set, Tuple, Any, Callable
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache, partial
+from itertools import islice
+from types import MappingProxyType
+from typing import Optional, Dict, Iterable, List, Mapping, Set, Tuple, Any, Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 import logging
+from collections import deque
 
+from revdownloader.concurrency import AdaptiveConcurrency
 from revdownloader.config import (
+    AUTO_CONCURRENCY_MAX,
+    AUTO_CONCURRENCY_PROBE_SECONDS,
+    DEFAULT_DOWNLOAD_PATH,
+    DISK_CHECK_TTL,
     DOWNLOAD_TIMEOUT,
+    FORBIDDEN_STREAK_LIMIT,
+    LOG_BUFFER_SIZE,
+    LOG_WIDGET_MAX_LINES,
+    MAX_CONCURRENT_DOWNLOADS,
     MAX_RETRIES,
-    RETRY_DELAY_BASE,
-    RETRY_MAX_DELAY,
+    PROGRESS_MIN_BYTES,
+    PROGRESS_MIN_INTERVAL,
+)
+from revdownloader.font_cache import (
+    default_font_cache_path,
+    load_font_families,
+    save_font_families,
 )
 from revdownloader.formatting import (
     format_eta,
@@ -46,10 +62,20 @@ from revdownloader.models import (
     DownloadSession,
     DownloadStatus,
 )
+from revdownloader.retry import backoff_delay
 from revdownloader.settings_repository import JsonSettingsRepository
 from revdownloader.theme import COLORS, ICONS_NERD, ICONS_STD, PAD, RADIUS
-from revdownloader.url_service import detect_platform, is_drm_platform, is_valid_url
+from revdownloader.url_service import (
+    classify_url,
+    detect_platform,
+    is_drm_platform,
+    is_playlist_url,
+    is_valid_url,
+)
+from revdownloader.ydl_pool import YoutubeDLPool
 from revdownloader.ytdlp_options import (
+    build_flat_options,
+    build_preview_options,
     build_tiktok_cli_options,
     build_ydl_options,
 )
@@ -64,6 +90,8 @@ if sys.platform == "win32":
     except Exception:
         pass
 
+from tkinter import filedialog
+
 import customtkinter as ctk
 from customtkinter import (
     CTk,
@@ -79,18 +107,32 @@ from customtkinter import (
     CTkRadioButton,
 )
 
+# Optional clipboard fallbacks, used when Tk cannot read the clipboard
+try:
+    import win32clipboard  # type: ignore
+except ImportError:
+    win32clipboard = None
+try:
+    import pyperclip  # type: ignore
+except ImportError:
+    pyperclip = None
+
 # Lazy imports for heavy modules
 _yt_dlp: Optional[Any] = None
 _tk: Optional[Any] = None
+_yt_dlp_lock = threading.Lock()
+_tk_lock = threading.Lock()
 
 
 def get_yt_dlp():
-    """Lazy load yt_dlp"""
+    """Lazy load yt_dlp (safe to call from download workers)"""
     global _yt_dlp
     if _yt_dlp is None:
-        import yt_dlp
+        with _yt_dlp_lock:
+            if _yt_dlp is None:
+                import yt_dlp
 
-        _yt_dlp = yt_dlp
+                _yt_dlp = yt_dlp
     return _yt_dlp
 
 
@@ -98,30 +140,75 @@ def get_tk():
     """Lazy load tkinter"""
     global _tk
     if _tk is None:
-        import tkinter as tk
+        with _tk_lock:
+            if _tk is None:
+                import tkinter as tk
 
-        _tk = tk
+                _tk = tk
     return _tk
 
 
+@lru_cache(maxsize=1)
+def _yt_dlp_command() -> Optional[Tuple[str, ...]]:
+    """Resolve the yt-dlp CLI once; None means use the bundled API instead"""
+    venv_exe = os.path.join(
+        os.path.dirname(sys.executable),
+        "yt-dlp.exe" if sys.platform == "win32" else "yt-dlp",
+    )
+    if os.path.isfile(venv_exe):
+        return (venv_exe,)
+    on_path = shutil.which("yt-dlp")
+    if on_path:
+        return (on_path,)
+    if not getattr(sys, "frozen", False):
+        return (sys.executable, "-m", "yt_dlp")
+    return None
+
+
+@lru_cache(maxsize=4)
+def _resolve_icon_path(program_path: str) -> Optional[str]:
+    """Find the window icon once; Windows uses the .ico, Tk elsewhere the .png"""
+    name = "icon.ico" if sys.platform == "win32" else "icon.png"
+    candidates = (
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "icons", name),
+        os.path.join(program_path, "assets", "icons", name),
+        os.path.join(program_path, name),  # Packaged distribution
+    )
+    return next((path for path in candidates if os.path.isfile(path)), None)
+
+
+def _read_win32_clipboard() -> str:
+    win32clipboard.OpenClipboard()
+    try:
+        return win32clipboard.GetClipboardData(win32clipboard.CF_UNICODETEXT)
+    finally:
+        win32clipboard.CloseClipboard()
+
+
 # =============================================================================
 # CACHED FONT DETECTION
 # =============================================================================
 @lru_cache(maxsize=1)
 def _get_system_fonts() -> Tuple[str, ...]:
-    """Cache system fonts - only called once"""
+    """Cache system fonts - read from disk cache, else probe a hidden Tk root"""
+    cache_path = default_font_cache_path()
+    fonts = load_font_families(cache_path)
+    if fonts is not None:
+        return fonts
     try:
         tk = get_tk()
         root = tk.Tk()
         fonts = tuple(root.tk.call("font", "families"))
         root.destroy()
-        return fonts
     except Exception:
         return ()
+    if fonts:
+        save_font_families(cache_path, fonts)
+    return fonts
 
 
 @lru_cache(maxsize=1)
-def get_font_config() -> Tuple[str, bool, Dict, Dict]:
+def get_font_config() -> Tuple[str, bool, Mapping[str, Tuple], Mapping[str, str]]:
     """Get font configuration - cached after first call"""
     fonts = _get_system_fonts()
     fonts_lower = {f.lower().replace(" ", ""): f for f in fonts}
@@ -174,12 +261,139 @@ def get_font_config() -> Tuple[str, bool, Dict, Dict]:
             "mono_small": ("Consolas", 10),
         }
 
-    return font_name, is_nerd, font_config, icons
+    return font_name, is_nerd, MappingProxyType(font_config), icons
 
 
 # Initialize font config once
 _FONT_NAME, _IS_NERD, FONTS, ICONS = get_font_config()
 
+# Log level -> (icon, color), resolved once the icon set is known
+_LOG_STYLES: Dict[str, Tuple[str, str]] = {
+    "error": (ICONS["error"], COLORS["danger"]),
+    "success": (ICONS["success"], COLORS["success"]),
+    "warning": (ICONS["warning"], COLORS["warning"]),
+    "info": (ICONS["info"], COLORS["text_secondary"]),
+    "download": (ICONS["downloading"], COLORS["accent"]),
+}
+_DEFAULT_LOG_STYLE = ("•", COLORS["text_secondary"])
+
+# Glass card frame options shared by every _create_card section
+_CARD_STYLE: Dict[str, Any] = {
+    "fg_color": COLORS["glass"],
+    "corner_radius": RADIUS["lg"],
+    "border_width": 1,
+    "border_color": COLORS["border"],
+}
+
+# _create_styled_button style name -> CTkButton colour options
+_BUTTON_STYLES: Dict[str, Dict[str, Any]] = {
+    "primary": {
+        "fg_color": COLORS["accent"],
+        "hover_color": COLORS["accent_hover"],
+        "text_color": "#000000",
+        "border_width": 0,
+    },
+    "secondary": {
+        "fg_color": COLORS["bg_card"],
+        "hover_color": COLORS["bg_card_hover"],
+        "text_color": COLORS["text_primary"],
+        "border_width": 1,
+        "border_color": COLORS["border"],
+    },
+    "danger": {
+        "fg_color": COLORS["danger"],
+        "hover_color": COLORS["danger_hover"],
+        "text_color": "#ffffff",
+        "border_width": 0,
+    },
+    "success": {
+        "fg_color": COLORS["success"],
+        "hover_color": COLORS["success_hover"],
+        "text_color": "#000000",
+        "border_width": 0,
+    },
+    "ghost": {
+        "fg_color": "transparent",
+        "hover_color": COLORS["bg_card_hover"],
+        "text_color": COLORS["text_secondary"],
+        "border_width": 1,
+        "border_color": COLORS["border"],
+    },
+}
+
+
+def _digits_or(default: int) -> Callable[[str], int]:
+    return lambda text: int(text) if text.isdigit() else default
+
+
+_limit_from_text = _digits_or(50)
+
+
+def _concurrency_setting(text: str):
+    """Persist "Auto" as-is and numeric choices as ints."""
+    return text if text == "Auto" else _digits_or(3)(text)
+
+
+def _is_digits_or_empty(text: str) -> bool:
+    """Entry key validator: accept only digits (or an empty field)."""
+    return not text or text.isdigit()
+
+
+def _format_playlist_preview(entries: List[Dict], title: str) -> str:
+    """Preview text for a playlist: header plus the first 50 entry titles."""
+    lines = [f"{ICONS['music']} {sanitize_text(title)}\n", "─" * 45 + "\n\n"]
+    for i, entry in enumerate(entries[:50], 1):
+        name = entry.get("title", "Unknown") if isinstance(entry, dict) else str(entry)
+        lines.append(f"{i:2d}. {truncate(sanitize_text(name), 55)}\n")
+    if len(entries) > 50:
+        lines.append(f"\n... and {len(entries) - 50} more ...")
+    return "".join(lines)
+
+
+def _items_from_entries(
+    entries: Iterable[Any], limit: Optional[int]
+) -> List[DownloadItem]:
+    """Download items for the first ``limit`` non-empty playlist entries."""
+    present = (entry for entry in entries if entry)
+    if limit:
+        present = islice(present, limit)
+    items = []
+    for i, entry in enumerate(present, 1):
+        item_url = entry.get("webpage_url") or entry.get("url", "")
+        if item_url:
+            title = entry.get("title", f"Item {i}")
+            items.append(DownloadItem(url=item_url, index=i, title=title))
+    return items
+
+
+# Characters of the download path shown next to "Save to:"
+_SAVE_LABEL_WIDTH = 38
+
+# Percentage in a yt-dlp "[download]  42.0% of ..." console line
+_PROGRESS_PATTERN = re.compile(r"(\d+\.?\d*)%")
+
+# Distinguishes "key absent" from a stored None/False in settings.json
+_MISSING = object()
+
+# settings.json key -> (Tk variable attribute, load converter, save converter)
+_SETTINGS_BINDINGS: Tuple[
+    Tuple[str, str, Optional[Callable], Optional[Callable]], ...
+] = (
+    ("download_type", "download_type_var", None, None),
+    ("audio_format", "format_var", None, None),
+    ("audio_quality", "quality_var", None, None),
+    ("video_resolution", "resolution_var", None, None),
+    ("video_format", "video_format_var", None, None),
+    ("concurrent", "concurrent_var", str, _concurrency_setting),
+    ("playlist", "playlist_var", None, None),
+    ("subtitle", "subtitle_var", None, None),
+    ("subtitle_embed", "subtitle_embed_var", None, None),
+    ("subtitle_lang", "subtitle_lang_var", None, None),
+    ("sponsorblock", "sponsorblock_var", None, None),
+    ("thumbnail", "thumbnail_var", None, None),
+    ("metadata", "metadata_var", None, None),
+)
+
 
 # =============================================================================
 # MAIN APPLICATION
@@ -189,37 +403,50 @@ class ModernDownloader:
         # Core state
         "window",
         "download_path",
+        "_download_path_ready",
+        "_disk_free_cache",
+        "_settings_dirty",
+        "_settings_flush_job",
+        "_collapse_flush_job",
+        "_playlist_limit",
         "is_downloading",
         "total_items",
         "downloaded_count",
         "failed_count",
-        "_current_file_progress",
+        "_progress_shown",
         "video_info",
         "entries_list",
         "last_url",
+        "_fetch_cancel",
         "log_queue",
+        "_log_tags",
         "_ui_queue",
-        "_log_after_id",
+        "_log_drain_pending",
+        "_log_drain_lock",
         "_ui_after_id",
+        "_pending_progress",
+        "_stats_pending",
+        "_progress_lock",
+        "_progress_local",
+        "_ydl_pool",
         "_update_job",
+        "_paste_job",
         "_download_executor",
+        "_download_executor_workers",
         "_download_futures",
-        "_downloaded_items",
-        "_failed_items",
+        "_concurrency",
         "_download_lock",
         "_cancel_event",
         "_active_processes",
         "_last_download_time",
         "_is_closing",
+        "_wheel_target",
+        "_platforms_dialog",
+        "_clipboard_readers",
         "program_path",
         "settings_file",
         "settings_repository",
         "current_session",
-        # Performance tracking
-        "_download_speed",
-        "_last_progress_time",
-        "_last_progress_bytes",
-        "_speed_update_interval",
         # UI structure (layout containers)
         "main_container",
         "scrollable_content",
@@ -228,7 +455,6 @@ class ModernDownloader:
         # UI elements
         "header_status",
         "url_entry",
-        "entry_frame",
         "platform_label",
         "preview_frame",
         "preview_text",
@@ -288,57 +514,84 @@ class ModernDownloader:
         self.total_items = 0
         self.downloaded_count = 0
         self.failed_count = 0
-        self._current_file_progress = 0.0
+        # (color bucket, whole percent) last drawn by _update_progress
+        self._progress_shown: Optional[Tuple[int, int]] = None
         self.video_info: Optional[Dict] = None
         self.entries_list: List[Dict] = []
         self.last_url = ""
+        # Set to abort the running preview fetch's retry backoff
+        self._fetch_cancel = threading.Event()
         self._update_job: Optional[str] = None
+        self._paste_job: Optional[str] = None
         self.current_session: Optional[DownloadSession] = None
         self.settings_collapsed = False
         self._is_closing = False
-
-        # Performance tracking
-        self._download_speed = 0.0
-        self._last_progress_time = 0.0
-        self._last_progress_bytes = 0
-        self._speed_update_interval = 1.0  # Update speed every second
+        self._wheel_target = None  # scroll frame under the pointer
+        self._platforms_dialog: Optional[ctk.CTkToplevel] = None
+        self._clipboard_readers: Optional[List[Callable[[], str]]] = None
 
         # Concurrent download state
-        self._download_executor: Optional[Any] = None
+        # Shared across sessions; rebuilt only when the worker count changes
+        self._download_executor: Optional[ThreadPoolExecutor] = None
+        self._download_executor_workers = 0
         self._download_futures: List[Any] = []
-        self._downloaded_items = 0
-        self._failed_items = 0
+        self._concurrency: Optional[AdaptiveConcurrency] = None  # Auto mode only
+        # Guards _active_processes; session progress has its own lock
         self._download_lock = threading.Lock()
         self._cancel_event = threading.Event()  # For faster cancel response
         self._active_processes: Set[Any] = set()
         self._last_download_time: Optional[float] = None  # For rate limiting
-
-        # Thread-safe logging
-        self.log_queue: queue.Queue = queue.Queue()
-        self._ui_queue: queue.Queue = queue.Queue()
-        self._log_after_id: Optional[str] = None
+        # Pooled YoutubeDL instances carry one fixed progress hook that
+        # dispatches to whichever item the current worker thread is on.
+        # Keep one idle instance per possible worker so no item rebuilds one
+        self._ydl_pool = YoutubeDLPool(
+            lambda options: get_yt_dlp().YoutubeDL(options),
+            max_idle_per_key=MAX_CONCURRENT_DOWNLOADS,
+        )
+        self._progress_local = threading.local()
+
+        # Thread-safe logging: deque append/popleft are atomic and a log flood
+        # only drops old lines. The drain is scheduled on demand; its lock
+        # only guards the pending flag.
+        self.log_queue: deque = deque(maxlen=LOG_BUFFER_SIZE)
+        self._log_drain_pending = False
+        self._log_drain_lock = threading.Lock()
+        self._log_tags: Set[str] = set()  # color tags already configured
+        self._ui_queue: queue.SimpleQueue = queue.SimpleQueue()
+        # Progress ticks arrive far faster than the UI can redraw; workers
+        # overwrite a single slot and the UI tick draws whatever is newest.
+        self._pending_progress: Optional[Tuple[float, float, str]] = None
+        # Completed/failed counts changed; redrawn once by the next UI tick
+        self._stats_pending = False
+        self._progress_lock = threading.Lock()
         self._ui_after_id: Optional[str] = None
 
         # Setup paths
-        self.download_path = str(Path.home() / "Downloads" / "REVMusic")
-        os.makedirs(self.download_path, exist_ok=True)
+        # Created on first download, not at startup
+        self.download_path = DEFAULT_DOWNLOAD_PATH
+        self._download_path_ready = False
+        # (monotonic time, path, free bytes) of the last disk-space probe
+        self._disk_free_cache: Optional[Tuple[float, str, int]] = None
 
         # Program directory for settings
         self.program_path = Path.cwd()
         self.settings_file = self.program_path / "settings.json"
         self.settings_repository = JsonSettingsRepository(self.settings_file)
+        self._settings_dirty = False
+        self._settings_flush_job: Optional[str] = None
+        self._collapse_flush_job: Optional[str] = None
 
         # Build UI first (creates all the variables)
         self._setup_window()
         self._build_ui()
-        self._start_log_processor()
         self._start_ui_processor()
 
-        # Load saved settings (after UI is built)
+        # Load saved settings (after UI is built), then track later edits
         self._load_settings()
+        self._watch_settings_changes()
 
-        # Background check
-        self.window.after(100, self._check_ffmpeg_async)
+        # Probe FFmpeg off the main thread; the result is applied via _call_ui
+        threading.Thread(target=self._check_ffmpeg_worker, daemon=True).start()
 
         # Save settings on window close
         self.window.protocol("WM_DELETE_WINDOW", self._on_close)
@@ -350,49 +603,25 @@ class ModernDownloader:
                 settings = self.settings_repository.load()
 
                 # Apply settings
-                if "download_path" in settings:
-                    candidate_path = settings["download_path"]
-                    try:
-                        os.makedirs(candidate_path, exist_ok=True)
-                        self.download_path = candidate_path
-                    except (PermissionError, OSError) as path_err:
-                        print(f"Inaccessible download path '{candidate_path}': {path_err}. Using default.")
-                        self.download_path = str(Path.home() / "Downloads" / "REVMusic")
-                        os.makedirs(self.download_path, exist_ok=True)
-                if "download_type" in settings:
-                    self.download_type_var.set(settings["download_type"])
-                if "audio_format" in settings:
-                    self.format_var.set(settings["audio_format"])
-                if "audio_quality" in settings:
-                    self.quality_var.set(settings["audio_quality"])
-                if "video_resolution" in settings:
-                    self.resolution_var.set(settings["video_resolution"])
-                if "video_format" in settings:
-                    self.video_format_var.set(settings["video_format"])
-                if "concurrent" in settings:
-                    self.concurrent_var.set(str(settings["concurrent"]))
-                if "playlist_limit" in settings:
-                    self.limit_var.set(str(settings["playlist_limit"]))
-                if "playlist" in settings:
-                    self.playlist_var.set(settings["playlist"])
-                if "subtitle" in settings:
-                    self.subtitle_var.set(settings["subtitle"])
-                if "subtitle_embed" in settings:
-                    self.subtitle_embed_var.set(settings["subtitle_embed"])
-                if "subtitle_lang" in settings:
-                    self.subtitle_lang_var.set(settings["subtitle_lang"])
-                if "sponsorblock" in settings:
-                    self.sponsorblock_var.set(settings["sponsorblock"])
-                if "thumbnail" in settings:
-                    self.thumbnail_var.set(settings["thumbnail"])
-                if "metadata" in settings:
-                    self.metadata_var.set(settings["metadata"])
-
-                # Update UI based on loaded download type (silent - no log)
-                self.window.after(100, lambda: self._on_type_changed(silent=True))
-
-                # Load collapse state
-                self.window.after(150, self._load_collapse_state)
+                download_path = settings.get("download_path", _MISSING)
+                if download_path is not _MISSING:
+                    # Validated lazily by _ensure_download_dir()
+                    self.download_path = download_path
+                    self._refresh_save_label()
+                playlist_limit = settings.get("playlist_limit", _MISSING)
+                if playlist_limit is not _MISSING:
+                    # The limit_var trace refreshes the _playlist_limit mirror
+                    self.limit_var.set(str(playlist_limit))
+                for key, var_name, to_var, _ in _SETTINGS_BINDINGS:
+                    value = settings.get(key, _MISSING)
+                    if value is not _MISSING:
+                        getattr(self, var_name).set(
+                            to_var(value) if to_var else value
+                        )
+
+                # The UI is already built, so apply these directly (silent - no log)
+                self._on_type_changed(silent=True)
+                self._load_collapse_state(settings)
 
                 print(f"Settings loaded from {self.settings_file}")
         except FileNotFoundError:
@@ -400,53 +629,66 @@ class ModernDownloader:
         except Exception as e:
             print(f"Could not load settings: {e}")
 
-    def _save_settings(self):
+    def _watch_settings_changes(self):
+        """Mark settings dirty whenever a persisted variable changes"""
+        for _, var_name, _, _ in _SETTINGS_BINDINGS:
+            getattr(self, var_name).trace_add("write", self._mark_settings_dirty)
+        self.limit_var.trace_add("write", self._mark_settings_dirty)
+
+    def _mark_settings_dirty(self, *_):
+        self._settings_dirty = True
+
+    def _schedule_settings_flush(self):
+        """Mark settings dirty and write them once changes settle"""
+        self._settings_dirty = True
+        if self._settings_flush_job is not None:
+            self.window.after_cancel(self._settings_flush_job)
+        self._settings_flush_job = self.window.after(500, self._flush_settings)
+
+    def _flush_settings(self):
+        self._settings_flush_job = None
+        self._save_settings(only_if_dirty=True)
+
+    def _save_settings(self, only_if_dirty: bool = False):
         """Save settings to settings.json"""
+        if only_if_dirty and not self._settings_dirty:
+            return
         try:
-            settings = {
+            settings: Dict[str, Any] = {
                 "download_path": self.download_path,
-                "download_type": self.download_type_var.get(),
-                "audio_format": self.format_var.get(),
-                "audio_quality": self.quality_var.get(),
-                "video_resolution": self.resolution_var.get(),
-                "video_format": self.video_format_var.get(),
-                "concurrent": (
-                    int(self.concurrent_var.get())
-                    if self.concurrent_var.get().isdigit()
-                    else 3
-                ),
-                "playlist_limit": (
-                    int(self.limit_var.get()) if self.limit_var.get().isdigit() else 50
-                ),
-                "playlist": self.playlist_var.get(),
-                "subtitle": self.subtitle_var.get(),
-                "subtitle_embed": self.subtitle_embed_var.get(),
-                "subtitle_lang": self.subtitle_lang_var.get(),
-                "sponsorblock": self.sponsorblock_var.get(),
-                "thumbnail": self.thumbnail_var.get(),
-                "metadata": self.metadata_var.get(),
+                "settings_collapsed": self.settings_collapsed,
+                # Saved from the validated int mirror, not the entry text
+                "playlist_limit": self._playlist_limit,
             }
+            for key, var_name, _, from_var in _SETTINGS_BINDINGS:
+                value = getattr(self, var_name).get()
+                settings[key] = from_var(value) if from_var else value
 
             self.settings_repository.update(settings)
+            self._settings_dirty = False
 
-            # Show success message in log
-            if hasattr(self, "log"):
-                self.log("Settings saved", "success")
-            else:
-                print(f"Settings saved to {self.settings_file}")
+            # log() appends to log_queue and, via _call_ui, queues one drain on
+            # _ui_queue; both exist before the UI and need no Tk call here
+            self.log("Settings saved", "success")
 
         except Exception as e:
-            error_msg = str(e)
-            if hasattr(self, "log"):
-                self.log(f"Could not save settings: {error_msg}", "error")
-            else:
-                print(f"Could not save settings: {error_msg}")
+            self.log(f"Could not save settings: {e}", "error")
 
     def _on_close(self):
         """Handle window close event"""
         self._is_closing = True
+        self._fetch_cancel.set()
         self._cancel_download()
-        self._save_settings()
+        if self._settings_flush_job is not None:
+            self.window.after_cancel(self._settings_flush_job)
+            self._settings_flush_job = None
+        if self._collapse_flush_job is not None:
+            self.window.after_cancel(self._collapse_flush_job)
+            self._flush_collapse_state()
+        self._save_settings(only_if_dirty=True)
+        if self._download_executor is not None:
+            self._download_executor.shutdown(wait=False)
+        self._ydl_pool.close()
         self.window.destroy()
 
     def _setup_window(self):
@@ -474,28 +716,16 @@ class ModernDownloader:
 
     def _set_window_icon(self):
         """Set window icon from icon file"""
+        icon_path = _resolve_icon_path(str(self.program_path))
+        if icon_path is None:
+            return
         try:
-            # Look for icon file in multiple locations
-            icon_paths = [
-                Path(__file__).resolve().parent / "assets" / "icons" / "icon.ico",
-                Path(self.program_path) / "assets" / "icons" / "icon.ico",
-                Path(self.program_path) / "icon.ico",  # Packaged distribution
-            ]
-
-            for icon_path in icon_paths:
-                if icon_path.exists():
-                    # For Windows
-                    if sys.platform == "win32":
-                        self.window.iconbitmap(str(icon_path))
-                    else:
-                        # For Linux/Mac - use PhotoImage
-                        import tkinter as tk
-
-                        icon = tk.PhotoImage(
-                            file=str(icon_path).replace(".ico", ".png")
-                        )
-                        self.window.tk.call("wm", "iconphoto", self.window._w, icon)
-                    break
+            if sys.platform == "win32":
+                self.window.iconbitmap(icon_path)
+            else:
+                # For Linux/Mac - use PhotoImage
+                icon = get_tk().PhotoImage(file=icon_path)
+                self.window.tk.call("wm", "iconphoto", self.window._w, icon)
         except Exception:
             # If icon fails to load, use default (no icon)
             pass
@@ -515,6 +745,11 @@ class ModernDownloader:
         )
         self.scrollable_content.pack(fill="both", expand=True, padx=PAD["lg"], pady=PAD["lg"])
         self._configure_smooth_scrolling(self.scrollable_content)
+        # Windows/macOS
+        self.window.bind_all("<MouseWheel>", self._on_mousewheel)
+        # Linux
+        self.window.bind_all("<Button-4>", self._on_mousewheel)
+        self.window.bind_all("<Button-5>", self._on_mousewheel)
 
         # Inner container that holds the stacked glass cards
         container = CTkFrame(self.scrollable_content, fg_color="transparent")
@@ -539,42 +774,36 @@ class ModernDownloader:
         # Configure scroll increment for smoother scrolling
         scroll_frame._scroll_speed = 15  # Smaller = smoother, larger = faster
 
-        def _on_mousewheel(event):
-            """Handle mouse wheel scrolling with smooth animation"""
-            # Determine scroll direction and amount
-            if event.delta:
-                # Windows/macOS
-                delta = -int(event.delta / 120) * scroll_frame._scroll_speed
-            else:
-                # Linux
-                delta = (
-                    scroll_frame._scroll_speed
-                    if event.num == 5
-                    else -scroll_frame._scroll_speed
-                )
-
-            # Scroll with animation
-            canvas.yview_scroll(delta, "units")
-            return "break"
-
+        # Wheel events are bound application-wide once (in _build_ui);
+        # Enter/Leave only record which scroll frame the pointer is over.
         def _on_enter(event):
-            """Bind mouse wheel when entering the widget"""
-            # Windows
-            canvas.bind_all("<MouseWheel>", _on_mousewheel)
-            # Linux
-            canvas.bind_all("<Button-4>", _on_mousewheel)
-            canvas.bind_all("<Button-5>", _on_mousewheel)
+            self._wheel_target = scroll_frame
 
         def _on_leave(event):
-            """Unbind mouse wheel when leaving the widget"""
-            canvas.unbind_all("<MouseWheel>")
-            canvas.unbind_all("<Button-4>")
-            canvas.unbind_all("<Button-5>")
+            if self._wheel_target is scroll_frame:
+                self._wheel_target = None
 
-        # Bind enter/leave events
         canvas.bind("<Enter>", _on_enter)
         canvas.bind("<Leave>", _on_leave)
 
+    def _on_mousewheel(self, event):
+        """Scroll the hovered scroll frame; leave the event alone elsewhere"""
+        target = self._wheel_target
+        if target is None or not target.winfo_exists():
+            return None
+        scroll_speed = target._scroll_speed
+        # Determine scroll direction and amount
+        if event.delta:
+            # Windows/macOS
+            delta = -int(event.delta / 120) * scroll_speed
+        else:
+            # Linux
+            delta = scroll_speed if event.num == 5 else -scroll_speed
+
+        # Scroll with animation
+        target._parent_canvas.yview_scroll(delta, "units")
+        return "break"
+
     def _build_header(self, parent):
         """Header: gradient logo + title, status pill, supported-platforms link."""
         # Brand row (logo + title left, status pill right)
@@ -684,31 +913,26 @@ class ModernDownloader:
         )
         self.platform_label.pack(side="right")
 
-        # Entry field with focus glow effect
-        self.entry_frame = CTkFrame(
+        # Entry field with focus glow effect (the entry draws its own border)
+        self.url_entry = CTkEntry(
             card,
+            placeholder_text="🔗  Paste a YouTube, SoundCloud, or other media URL...",
+            font=FONTS["body"],
             fg_color=COLORS["bg_secondary"],
             corner_radius=RADIUS["md"],
-            height=58,
             border_width=2,
             border_color=COLORS["border"],
+            height=58,
         )
-        self.entry_frame.pack(fill="x", padx=PAD["xl"], pady=(0, PAD["sm"]))
-        self.entry_frame.pack_propagate(False)
+        self.url_entry.pack(fill="x", padx=PAD["xl"], pady=(0, PAD["sm"]))
 
-        self.url_entry = CTkEntry(
-            self.entry_frame,
-            placeholder_text="🔗  Paste a YouTube, SoundCloud, or other media URL...",
-            font=FONTS["body"],
-            fg_color="transparent",
-            border_width=0,
-            height=54,
-        )
-        self.url_entry.pack(fill="both", expand=True, padx=PAD["md"], pady=1)
+        # Focus glow is shared by every entry tagged "RevEntry" (bound once)
+        self.window.bind_class("RevEntry", "<FocusIn>", self._on_entry_focus_in)
+        self.window.bind_class("RevEntry", "<FocusOut>", self._on_entry_focus_out)
+        inner_entry = self.url_entry._entry
+        inner_entry.bindtags(("RevEntry",) + inner_entry.bindtags())
 
-        # Focus effects + key bindings
-        self.url_entry.bind("<FocusIn>", self._on_entry_focus_in)
-        self.url_entry.bind("<FocusOut>", self._on_entry_focus_out)
+        # Key bindings
         self.url_entry.bind("<Return>", lambda e: self.start_download())
         self.url_entry.bind("<Control-v>", self._on_paste)
         self.url_entry.bind("<KeyRelease>", self._on_url_changed)
@@ -795,13 +1019,13 @@ class ModernDownloader:
             content,
             fg_color=COLORS["bg_secondary"],
             corner_radius=RADIUS["md"],
-            height=150,
         )
         self.preview_frame.pack(side="left", fill="both", expand=True)
-        self.preview_frame.pack_propagate(False)
 
+        # Fixed textbox height; the frame sizes itself around it
         self.preview_text = CTkTextbox(
             self.preview_frame,
+            height=134,
             font=FONTS["mono"],
             fg_color="transparent",
             text_color=COLORS["text_primary"],
@@ -871,6 +1095,36 @@ class ModernDownloader:
                 text_color=COLORS["text_muted"],
             ).grid(row=row, column=col, sticky="w", **kw)
 
+        # Shared widget styles: every dropdown and switch in this card looks alike
+        option_menu_style = dict(
+            font=FONTS["ui"],
+            fg_color=COLORS["bg_secondary"],
+            button_color=COLORS["border"],
+            button_hover_color=COLORS["accent"],
+            dropdown_fg_color=COLORS["bg_card"],
+            dropdown_hover_color=COLORS["bg_card_hover"],
+            corner_radius=RADIUS["sm"],
+        )
+        switch_style = dict(
+            font=FONTS["ui"],
+            progress_color=COLORS["accent"],
+            button_color=COLORS["text_secondary"],
+            button_hover_color=COLORS["accent_hover"],
+        )
+
+        def _option_menu(master, values, variable, width, height=34):
+            return CTkOptionMenu(
+                master,
+                values=values,
+                variable=variable,
+                width=width,
+                height=height,
+                **option_menu_style,
+            )
+
+        def _switch(master, text, variable):
+            return CTkSwitch(master, text=text, variable=variable, **switch_style)
+
         # ---- Row 0-1: Download Type (segmented radio) ----
         _section_label(settings_grid, 0, 0, "Download Type")
 
@@ -913,26 +1167,12 @@ class ModernDownloader:
         switches_frame.grid(row=2, column=0, columnspan=3, sticky="w", pady=(PAD["md"], 0))
 
         self.metadata_var = ctk.BooleanVar(value=True)
-        CTkSwitch(
-            switches_frame,
-            text="Add metadata",
-            variable=self.metadata_var,
-            font=FONTS["ui"],
-            progress_color=COLORS["accent"],
-            button_color=COLORS["text_secondary"],
-            button_hover_color=COLORS["accent_hover"],
-        ).pack(side="left")
+        _switch(switches_frame, "Add metadata", self.metadata_var).pack(side="left")
 
         self.thumbnail_var = ctk.BooleanVar(value=True)
-        CTkSwitch(
-            switches_frame,
-            text="Embed thumbnail",
-            variable=self.thumbnail_var,
-            font=FONTS["ui"],
-            progress_color=COLORS["accent"],
-            button_color=COLORS["text_secondary"],
-            button_hover_color=COLORS["accent_hover"],
-        ).pack(side="left", padx=(PAD["xl"], 0))
+        _switch(switches_frame, "Embed thumbnail", self.thumbnail_var).pack(
+            side="left", padx=(PAD["xl"], 0)
+        )
 
         # ---- Row 3: Audio Options (Quality & Format) ----
         self.audio_options_frame = CTkFrame(settings_grid, fg_color="transparent")
@@ -944,36 +1184,20 @@ class ModernDownloader:
         _section_label(self.audio_options_frame, 0, 1, "Format", padx=(PAD["lg"], 0))
 
         self.quality_var = ctk.StringVar(value="320")
-        self.quality_menu = CTkOptionMenu(
+        self.quality_menu = _option_menu(
             self.audio_options_frame,
-            values=["128", "192", "256", "320", "lossless"],
-            variable=self.quality_var,
+            ["128", "192", "256", "320", "lossless"],
+            self.quality_var,
             width=110,
-            height=34,
-            font=FONTS["ui"],
-            fg_color=COLORS["bg_secondary"],
-            button_color=COLORS["border"],
-            button_hover_color=COLORS["accent"],
-            dropdown_fg_color=COLORS["bg_card"],
-            dropdown_hover_color=COLORS["bg_card_hover"],
-            corner_radius=RADIUS["sm"],
         )
         self.quality_menu.grid(row=1, column=0, sticky="w", pady=(4, 0))
 
         self.format_var = ctk.StringVar(value="mp3")
-        self.format_menu = CTkOptionMenu(
+        self.format_menu = _option_menu(
             self.audio_options_frame,
-            values=["mp3", "m4a", "aac", "wav", "flac", "ogg", "opus", "wma", "aiff", "webm"],
-            variable=self.format_var,
+            ["mp3", "m4a", "aac", "wav", "flac", "ogg", "opus", "wma", "aiff", "webm"],
+            self.format_var,
             width=110,
-            height=34,
-            font=FONTS["ui"],
-            fg_color=COLORS["bg_secondary"],
-            button_color=COLORS["border"],
-            button_hover_color=COLORS["accent"],
-            dropdown_fg_color=COLORS["bg_card"],
-            dropdown_hover_color=COLORS["bg_card_hover"],
-            corner_radius=RADIUS["sm"],
         )
         self.format_menu.grid(row=1, column=1, sticky="w", padx=(PAD["lg"], 0), pady=(4, 0))
 
@@ -985,36 +1209,20 @@ class ModernDownloader:
         _section_label(self.video_options_frame, 0, 1, "Format", padx=(PAD["sm"], 0))
 
         self.resolution_var = ctk.StringVar(value="1080p")
-        self.resolution_menu = CTkOptionMenu(
+        self.resolution_menu = _option_menu(
             self.video_options_frame,
-            values=["144p", "240p", "360p", "480p", "720p", "1080p", "1440p", "2160p (4K)", "4320p (8K)", "Best"],
-            variable=self.resolution_var,
+            ["144p", "240p", "360p", "480p", "720p", "1080p", "1440p", "2160p (4K)", "4320p (8K)", "Best"],
+            self.resolution_var,
             width=110,
-            height=34,
-            font=FONTS["ui"],
-            fg_color=COLORS["bg_secondary"],
-            button_color=COLORS["border"],
-            button_hover_color=COLORS["accent"],
-            dropdown_fg_color=COLORS["bg_card"],
-            dropdown_hover_color=COLORS["bg_card_hover"],
-            corner_radius=RADIUS["sm"],
         )
         self.resolution_menu.grid(row=1, column=0, sticky="w", pady=(4, 0))
 
         self.video_format_var = ctk.StringVar(value="mp4")
-        self.video_format_menu = CTkOptionMenu(
+        self.video_format_menu = _option_menu(
             self.video_options_frame,
-            values=["mp4", "mkv", "webm", "mov", "avi", "flv", "3gp", "ts", "m4v", "wmv", "ogv"],
-            variable=self.video_format_var,
+            ["mp4", "mkv", "webm", "mov", "avi", "flv", "3gp", "ts", "m4v", "wmv", "ogv"],
+            self.video_format_var,
             width=100,
-            height=34,
-            font=FONTS["ui"],
-            fg_color=COLORS["bg_secondary"],
-            button_color=COLORS["border"],
-            button_hover_color=COLORS["accent"],
-            dropdown_fg_color=COLORS["bg_card"],
-            dropdown_hover_color=COLORS["bg_card_hover"],
-            corner_radius=RADIUS["sm"],
         )
         self.video_format_menu.grid(row=1, column=1, sticky="w", padx=(PAD["sm"], 0), pady=(4, 0))
 
@@ -1025,57 +1233,30 @@ class ModernDownloader:
         subtitle_frame.grid(row=3, column=0, columnspan=3, sticky="w", pady=(4, 0))
 
         self.subtitle_var = ctk.BooleanVar(value=False)
-        CTkSwitch(
-            subtitle_frame,
-            text="Download subtitles",
-            variable=self.subtitle_var,
-            font=FONTS["ui"],
-            progress_color=COLORS["accent"],
-            button_color=COLORS["text_secondary"],
-            button_hover_color=COLORS["accent_hover"],
-        ).pack(side="left")
+        _switch(subtitle_frame, "Download subtitles", self.subtitle_var).pack(side="left")
 
         self.subtitle_lang_var = ctk.StringVar(value="en")
-        self.subtitle_lang_menu = CTkOptionMenu(
+        self.subtitle_lang_menu = _option_menu(
             subtitle_frame,
-            values=["en (English)", "th (Thai)", "ja (Japanese)", "ko (Korean)", "zh (Chinese)", "es (Spanish)", "fr (French)", "de (German)", "auto (Auto-detect)"],
-            variable=self.subtitle_lang_var,
+            ["en (English)", "th (Thai)", "ja (Japanese)", "ko (Korean)", "zh (Chinese)", "es (Spanish)", "fr (French)", "de (German)", "auto (Auto-detect)"],
+            self.subtitle_lang_var,
             width=140,
             height=30,
-            font=FONTS["ui"],
-            fg_color=COLORS["bg_secondary"],
-            button_color=COLORS["border"],
-            button_hover_color=COLORS["accent"],
-            dropdown_fg_color=COLORS["bg_card"],
-            dropdown_hover_color=COLORS["bg_card_hover"],
-            corner_radius=RADIUS["sm"],
         )
         self.subtitle_lang_menu.pack(side="left", padx=(PAD["md"], 0))
 
         self.subtitle_embed_var = ctk.BooleanVar(value=True)
-        CTkSwitch(
-            subtitle_frame,
-            text="Embed",
-            variable=self.subtitle_embed_var,
-            font=FONTS["ui"],
-            progress_color=COLORS["accent"],
-            button_color=COLORS["text_secondary"],
-            button_hover_color=COLORS["accent_hover"],
-        ).pack(side="left", padx=(PAD["md"], 0))
+        _switch(subtitle_frame, "Embed", self.subtitle_embed_var).pack(
+            side="left", padx=(PAD["md"], 0)
+        )
 
         # SponsorBlock
         sponsor_frame = CTkFrame(self.video_options_frame, fg_color="transparent")
         sponsor_frame.grid(row=4, column=0, columnspan=3, sticky="w", pady=(PAD["sm"], 0))
 
         self.sponsorblock_var = ctk.BooleanVar(value=False)
-        CTkSwitch(
-            sponsor_frame,
-            text="Remove sponsors (SponsorBlock)",
-            variable=self.sponsorblock_var,
-            font=FONTS["ui"],
-            progress_color=COLORS["accent"],
-            button_color=COLORS["text_secondary"],
-            button_hover_color=COLORS["accent_hover"],
+        _switch(
+            sponsor_frame, "Remove sponsors (SponsorBlock)", self.sponsorblock_var
         ).pack(side="left")
 
         # ---- Row 8-9: Playlist, Limit & Concurrent ----
@@ -1084,26 +1265,22 @@ class ModernDownloader:
         _section_label(settings_grid, 8, 2, "Concurrent", padx=(PAD["lg"], 0), pady=(PAD["lg"], 0))
 
         self.playlist_var = ctk.BooleanVar(value=True)
-        self.playlist_switch = CTkSwitch(
-            settings_grid,
-            text="Download playlist",
-            variable=self.playlist_var,
-            font=FONTS["ui"],
-            progress_color=COLORS["accent"],
-            button_color=COLORS["text_secondary"],
-            button_hover_color=COLORS["accent_hover"],
-        )
+        self.playlist_switch = _switch(settings_grid, "Download playlist", self.playlist_var)
         self.playlist_switch.grid(row=9, column=0, sticky="w", pady=(4, 0))
 
         limit_frame = CTkFrame(settings_grid, fg_color="transparent")
         limit_frame.grid(row=9, column=1, sticky="w", padx=(PAD["lg"], 0), pady=(4, 0))
 
         self.limit_var = ctk.StringVar(value="50")
+        self._playlist_limit = 50
+        self.limit_var.trace_add("write", self._on_limit_changed)
         CTkEntry(
             limit_frame,
             width=64,
             height=30,
             textvariable=self.limit_var,
+            validate="key",
+            validatecommand=(self.window.register(_is_digits_or_empty), "%P"),
             font=FONTS["ui"],
             fg_color=COLORS["bg_secondary"],
             border_color=COLORS["border"],
@@ -1120,19 +1297,12 @@ class ModernDownloader:
         concurrent_frame.grid(row=9, column=2, sticky="w", padx=(PAD["lg"], 0), pady=(4, 0))
 
         self.concurrent_var = ctk.StringVar(value="3")
-        CTkOptionMenu(
+        _option_menu(
             concurrent_frame,
-            values=["1", "2", "3", "4", "5", "6", "8", "10"],
-            variable=self.concurrent_var,
+            ["Auto", "1", "2", "3", "4", "5", "6", "8", "10"],
+            self.concurrent_var,
             width=72,
             height=30,
-            font=FONTS["ui"],
-            fg_color=COLORS["bg_secondary"],
-            button_color=COLORS["border"],
-            button_hover_color=COLORS["accent"],
-            dropdown_fg_color=COLORS["bg_card"],
-            dropdown_hover_color=COLORS["bg_card_hover"],
-            corner_radius=RADIUS["sm"],
         ).pack(side="left")
         CTkLabel(
             concurrent_frame,
@@ -1179,7 +1349,7 @@ class ModernDownloader:
         ).pack(side="left")
         self.save_label = CTkLabel(
             save_frame,
-            text=truncate(self.download_path, 38),
+            text=truncate(self.download_path, _SAVE_LABEL_WIDTH),
             font=FONTS["mono_small"],
             text_color=COLORS["text_primary"],
         )
@@ -1428,13 +1598,7 @@ class ModernDownloader:
 
     def _create_card(self, parent) -> CTkFrame:
         """Create a glassmorphism card frame."""
-        return CTkFrame(
-            parent,
-            fg_color=COLORS["glass"],
-            corner_radius=RADIUS["lg"],
-            border_width=1,
-            border_color=COLORS["border"],
-        )
+        return CTkFrame(parent, **_CARD_STYLE)
 
     def _create_styled_button(
         self,
@@ -1448,42 +1612,7 @@ class ModernDownloader:
         **kwargs,
     ) -> CTkButton:
         """Create styled button with consistent effects"""
-        styles = {
-            "primary": {
-                "fg_color": COLORS["accent"],
-                "hover_color": COLORS["accent_hover"],
-                "text_color": "#000000",
-                "border_width": 0,
-            },
-            "secondary": {
-                "fg_color": COLORS["bg_card"],
-                "hover_color": COLORS["bg_card_hover"],
-                "text_color": COLORS["text_primary"],
-                "border_width": 1,
-                "border_color": COLORS["border"],
-            },
-            "danger": {
-                "fg_color": COLORS["danger"],
-                "hover_color": COLORS["danger_hover"],
-                "text_color": "#ffffff",
-                "border_width": 0,
-            },
-            "success": {
-                "fg_color": COLORS["success"],
-                "hover_color": COLORS["success_hover"],
-                "text_color": "#000000",
-                "border_width": 0,
-            },
-            "ghost": {
-                "fg_color": "transparent",
-                "hover_color": COLORS["bg_card_hover"],
-                "text_color": COLORS["text_secondary"],
-                "border_width": 1,
-                "border_color": COLORS["border"],
-            },
-        }
-
-        btn_style = styles.get(style, styles["primary"])
+        btn_style = _BUTTON_STYLES.get(style, _BUTTON_STYLES["primary"])
         btn_text = f"{icon} {text}" if icon else text
 
         btn = CTkButton(
@@ -1507,10 +1636,6 @@ class ModernDownloader:
     # =================================================================
     # LOGGING SYSTEM (Thread-safe with queue)
     # =================================================================
-    def _start_log_processor(self):
-        """Start background log processor"""
-        self._process_log_queue()
-
     def _start_ui_processor(self):
         """Start the main-thread processor for callbacks from worker threads."""
         self._process_ui_queue()
@@ -1520,11 +1645,32 @@ class ModernDownloader:
         if not self._is_closing:
             self._ui_queue.put(callback)
 
+    def _post_progress(self, percent: float, speed: float = 0.0, eta: str = "") -> None:
+        """Replace the pending progress update with a newer one."""
+        with self._progress_lock:
+            self._pending_progress = (percent, speed, eta)
+
+    def _post_stats(self) -> None:
+        """Ask the next UI tick to redraw the stats label."""
+        with self._progress_lock:
+            self._stats_pending = True
+
+    def _apply_pending_progress(self) -> None:
+        """Draw the newest posted progress and stats, if any (main thread only)."""
+        with self._progress_lock:
+            latest, self._pending_progress = self._pending_progress, None
+            stats, self._stats_pending = self._stats_pending, False
+        if latest is not None:
+            self._update_progress_with_speed(*latest)
+        if stats:
+            self._update_stats()
+
     def _process_ui_queue(self):
         """Run queued UI callbacks without letting workers call Tk directly."""
         if self._is_closing:
             return
         try:
+            self._apply_pending_progress()
             processed = 0
             while processed < 50:
                 try:
@@ -1541,84 +1687,88 @@ class ModernDownloader:
                 self._ui_after_id = self.window.after(25, self._process_ui_queue)
 
     def _process_log_queue(self):
-        """Process log queue in main thread"""
+        """Drain the log ring buffer in main thread"""
+        # Clear the flag before draining so a record appended mid-drain
+        # schedules another pass instead of waiting for the next log call.
+        with self._log_drain_lock:
+            self._log_drain_pending = False
+        pop = self.log_queue.popleft
+        records = []
         try:
-            processed = 0
-            while processed < 10:  # Process up to 10 messages per cycle
-                try:
-                    timestamp, icon, message, color = self.log_queue.get_nowait()
-                    self._append_log(timestamp, icon, message, color)
-                    processed += 1
-                except queue.Empty:
-                    break
-        except Exception:
+            while True:
+                records.append(pop())
+        except IndexError:
             pass
-        if not self._is_closing:
-            self._log_after_id = self.window.after(
-                50, self._process_log_queue
-            )  # Faster updates
+        if records:
+            self._append_log_records(records)
 
     def log(self, message: str, level: str = "info"):
         """Thread-safe logging"""
         timestamp = datetime.now().strftime("%H:%M:%S")
         message = sanitize_text(message)
-
-        colors = {
-            "error": COLORS["danger"],
-            "success": COLORS["success"],
-            "warning": COLORS["warning"],
-            "info": COLORS["text_secondary"],
-            "download": COLORS["accent"],
-        }
-        icons_map = {
-            "error": ICONS["error"],
-            "success": ICONS["success"],
-            "warning": ICONS["warning"],
-            "info": ICONS["info"],
-            "download": ICONS["downloading"],
-        }
-
-        self.log_queue.put(
-            (
-                timestamp,
-                icons_map.get(level, "•"),
-                message,
-                colors.get(level, COLORS["text_secondary"]),
-            )
-        )
+        icon, color = _LOG_STYLES.get(level, _DEFAULT_LOG_STYLE)
+        self.log_queue.append((timestamp, icon, message, color))
+        # Wake the UI only when no drain is already scheduled; idle logs cost
+        # no timer wake-ups at all.
+        with self._log_drain_lock:
+            if self._log_drain_pending:
+                return
+            self._log_drain_pending = True
+        self._call_ui(self._process_log_queue)
 
     def log_error(self, message: str, exc_info: bool = False):
         """Log error with optional traceback"""
         if exc_info:
+            import traceback
+
             tb = traceback.format_exc()
             message = f"{message}\n{tb}"
         self.log(message, "error")
 
-    def _append_log(self, timestamp: str, icon: str, message: str, color: str):
-        """Append to log widget (main thread only) with line limit to prevent memory bloat"""
+    def _append_log_records(self, records: List[Tuple[str, str, str, str]]):
+        """Append a batch of log records with one insert (main thread only)"""
         if self._is_closing:
             return
         try:
+            # A flood larger than the widget keeps would be trimmed right away
+            records = records[-LOG_WIDGET_MAX_LINES:]
             self.log_text.configure(state="normal")
-            # Limit log widget memory footprint by trimming old lines
-            try:
-                line_count = int(self.log_text.index("end-1c").split(".")[0])
-                if line_count > 500:
-                    self.log_text.delete("1.0", "50.0")
-            except Exception:
-                pass
-            tag_name = f"color_{color.replace('#', '')}"
-            try:
-                self.log_text.tag_config(tag_name, foreground=color)
-            except Exception:
-                pass
-            self.log_text.insert("end", f"[{timestamp}] {icon} {message}\n", tag_name)
+            start_line = int(self.log_text.index("end-1c").split(".")[0])
+            lines = [
+                f"[{timestamp}] {icon} {message}\n"
+                for timestamp, icon, message, _ in records
+            ]
+            self.log_text.insert("end", "".join(lines))
+
+            # Color consecutive records that share a color with one tag range.
+            line = start_line
+            run_start, run_color = line, records[0][3]
+            for text, (_, _, _, color) in zip(lines, records):
+                if color != run_color:
+                    self._tag_log_lines(run_color, run_start, line)
+                    run_start, run_color = line, color
+                line += text.count("\n")
+            self._tag_log_lines(run_color, run_start, line)
+
+            # Trim old lines once per batch to bound the widget's memory
+            excess = line - 1 - LOG_WIDGET_MAX_LINES
+            if excess > 0:
+                self.log_text.delete("1.0", f"{excess + 1}.0")
+
             # Auto-scroll to end
             self.log_text.see("end")
             self.log_text.configure(state="disabled")
         except Exception as e:
             print(f"Log error: {e}")
 
+    def _tag_log_lines(self, color: str, first_line: int, end_line: int):
+        """Apply the foreground tag for color to lines [first_line, end_line)"""
+        tag_name = f"color_{color.replace('#', '')}"
+        if tag_name not in self._log_tags:
+            self.log_text.tag_config(tag_name, foreground=color)
+            self._log_tags.add(tag_name)
+        self.log_text.tag_add(tag_name, f"{first_line}.0", f"{end_line}.0")
+
     def _clear_log(self):
         """Clear log"""
         self.log_text.configure(state="normal")
@@ -1629,8 +1779,6 @@ class ModernDownloader:
     def _save_log(self):
         """Save log to file"""
         try:
-            from tkinter import filedialog
-
             filename = filedialog.asksaveasfilename(
                 defaultextension=".txt",
                 filetypes=[("Text files", "*.txt")],
@@ -1647,17 +1795,19 @@ class ModernDownloader:
     # URL HANDLING
     # =================================================================
     def _on_paste(self, event=None):
-        """Handle paste event"""
-        self.window.after(100, self._paste_url)
+        """Handle paste event (rapid repeats collapse into one paste)"""
+        if self._paste_job:
+            self.window.after_cancel(self._paste_job)
+        self._paste_job = self.window.after(100, self._paste_url)
         return "break"
 
-    def _on_entry_focus_in(self, event=None):
-        """Handle entry focus in - highlight border"""
-        self.entry_frame.configure(border_color=COLORS["accent"])
+    def _on_entry_focus_in(self, event):
+        """Handle entry focus in - highlight the focused CTkEntry's border"""
+        event.widget.master.configure(border_color=COLORS["accent"])
 
-    def _on_entry_focus_out(self, event=None):
+    def _on_entry_focus_out(self, event):
         """Handle entry focus out - reset border"""
-        self.entry_frame.configure(border_color=COLORS["border"])
+        event.widget.master.configure(border_color=COLORS["border"])
 
     def _on_url_changed(self, event=None):
         """Debounce previews for URLs entered without the Paste action."""
@@ -1700,60 +1850,50 @@ class ModernDownloader:
             return
 
         self.last_url = candidate
+        self._fetch_cancel.set()
         self.video_info = None
         self.entries_list = []
-        platform = self._detect_platform(candidate)
+        url_info = classify_url(candidate)
+        platform = url_info.platform
         self.platform_label.configure(
             text=f"Detected: {platform}" if platform else ""
         )
 
-        if not self._validate_url(candidate):
-            self.preview_text.configure(state="normal")
-            self.preview_text.delete("1.0", "end")
-            self.preview_text.insert("end", "Enter a valid URL to see track list...")
-            self.preview_text.configure(state="disabled")
+        if not url_info.valid:
+            self._set_preview_text("Enter a valid URL to see track list...")
             self.song_count.configure(text="0 tracks")
             return
 
         self._preview_loading()
-        self._update_job = self.window.after(
-            500, lambda url=candidate: self._fetch_info(url)
-        )
+        self._update_job = self.window.after(500, self._fetch_info, candidate)
 
     def _paste_url(self):
         """Paste from clipboard"""
+        self._paste_job = None
         url = self._get_clipboard_text()
         if url and url != self.last_url:
             self._process_url(url.strip())
 
     def _get_clipboard_text(self) -> str:
-        """Get text from clipboard with multiple fallback methods"""
-        # Try tkinter clipboard first
-        try:
-            return self.window.clipboard_get()
-        except Exception:
-            pass
-
-        # Try win32clipboard on Windows
-        if sys.platform == "win32":
+        """Get clipboard text, trying the backend that last worked first"""
+        readers = self._clipboard_readers
+        if readers is None:
+            readers = [self.window.clipboard_get]
+            if win32clipboard is not None:
+                readers.append(_read_win32_clipboard)
+            if pyperclip is not None:
+                readers.append(pyperclip.paste)
+            self._clipboard_readers = readers
+
+        for index, reader in enumerate(readers):
             try:
-                import win32clipboard  # type: ignore
-
-                win32clipboard.OpenClipboard()
-                text = win32clipboard.GetClipboardData(win32clipboard.CF_UNICODETEXT)
-                win32clipboard.CloseClipboard()
-                return text
+                text = reader()
             except Exception:
-                pass
-
-        # Try pyperclip
-        try:
-            import pyperclip
-
-            return pyperclip.paste()
-        except Exception:
-            pass
-
+                continue
+            if index:
+                # Promote the working backend so later pastes try it first
+                readers.insert(0, readers.pop(index))
+            return text
         return ""
 
     def _process_url(self, url: str):
@@ -1765,6 +1905,7 @@ class ModernDownloader:
             url = f"https://{url}"
 
         self.last_url = url
+        self._fetch_cancel.set()
         # Invalidate cached preview data immediately so a fast click cannot
         # download entries belonging to the previous URL.
         self.video_info = None
@@ -1773,12 +1914,12 @@ class ModernDownloader:
         self.url_entry.insert(0, url)
 
         # Detect platform
-        platform = self._detect_platform(url)
-        if platform:
-            self.platform_label.configure(text=f"Detected: {platform}")
+        url_info = classify_url(url)
+        if url_info.platform:
+            self.platform_label.configure(text=f"Detected: {url_info.platform}")
 
         self.log(f"URL pasted: {truncate(url, 50)}...", "info")
-        if not self._validate_url(url):
+        if not url_info.valid:
             self.log("Invalid URL format", "error")
             self._preview_error()
             return
@@ -1787,7 +1928,7 @@ class ModernDownloader:
         # Debounce fetch
         if self._update_job:
             self.window.after_cancel(self._update_job)
-        self._update_job = self.window.after(300, lambda: self._fetch_info(url))
+        self._update_job = self.window.after(300, self._fetch_info, url)
 
     def _detect_platform(self, url: str) -> Optional[str]:
         """Detect the source platform."""
@@ -1801,21 +1942,55 @@ class ModernDownloader:
         """Validate an HTTP(S) URL."""
         return is_valid_url(url)
 
+    def _ensure_download_dir(self) -> bool:
+        """Create the download folder on first use, falling back to the default"""
+        if self._download_path_ready:
+            return True
+        try:
+            os.makedirs(self.download_path, exist_ok=True)
+        except OSError as e:
+            if self.download_path == DEFAULT_DOWNLOAD_PATH:
+                self.log(f"Cannot create download folder: {truncate(str(e), 50)}", "error")
+                return False
+            self.log("Save folder is not accessible - using default", "warning")
+            self.download_path = DEFAULT_DOWNLOAD_PATH
+            self._settings_dirty = True
+            self._refresh_save_label()
+            return self._ensure_download_dir()
+        self._download_path_ready = True
+        return True
+
     def _check_disk_space(self, required_mb: int = 500) -> bool:
         """Check if download path has enough space (default 500MB)"""
-        try:
-            path = Path(self.download_path)
-            # Create directory if not exists
-            path.mkdir(parents=True, exist_ok=True)
-            stat = shutil.disk_usage(path)
-            free_mb = stat.free / (1024 * 1024)
-            return free_mb >= required_mb
-        except Exception:
-            return True  # Assume OK if can't check
+        now = time.monotonic()
+        cached = self._disk_free_cache
+        # Free space barely moves between back-to-back downloads, and the probe
+        # can stall on network drives; reuse it for DISK_CHECK_TTL seconds.
+        if (
+            cached is not None
+            and cached[1] == self.download_path
+            and now - cached[0] < DISK_CHECK_TTL
+        ):
+            free = cached[2]
+        else:
+            try:
+                free = shutil.disk_usage(self.download_path).free
+            except Exception:
+                return True  # Assume OK if can't check
+            self._disk_free_cache = (now, self.download_path, free)
+        return free / (1024 * 1024) >= required_mb
 
     def _show_supported_platforms(self):
-        """Show dialog with supported platforms list"""
+        """Show dialog with supported platforms list (built on first open)"""
+        dialog = self._platforms_dialog
+        if dialog is not None and dialog.winfo_exists():
+            dialog.deiconify()
+            dialog.lift()
+            dialog.grab_set()
+            return
+
         dialog = ctk.CTkToplevel(self.window)
+        self._platforms_dialog = dialog
         dialog.title("Supported Platforms")
         dialog.geometry("400x450")
         dialog.configure(fg_color=COLORS["bg_primary"])
@@ -1870,15 +2045,12 @@ class ModernDownloader:
         ]
 
         for item in platforms:
-            item_frame = CTkFrame(scroll_frame, fg_color="transparent")
-            item_frame.pack(fill="x", pady=3, padx=10)
-
             CTkLabel(
-                item_frame,
+                scroll_frame,
                 text=f"  • {item}",
                 font=FONTS["ui"],
                 text_color=COLORS["text_secondary"],
-            ).pack(anchor="w")
+            ).pack(anchor="w", pady=3, padx=10)
 
         # DRM Warning
         CTkLabel(
@@ -1890,15 +2062,12 @@ class ModernDownloader:
 
         drm_platforms = ["Spotify", "Apple Music", "Amazon Music", "Tidal", "Deezer"]
         for item in drm_platforms:
-            item_frame = CTkFrame(scroll_frame, fg_color="transparent")
-            item_frame.pack(fill="x", pady=2, padx=10)
-
             CTkLabel(
-                item_frame,
+                scroll_frame,
                 text=f"  • {item}",
                 font=FONTS["ui"],
                 text_color=COLORS["text_muted"],
-            ).pack(anchor="w")
+            ).pack(anchor="w", pady=2, padx=10)
 
         # Close button
         close_btn = CTkButton(
@@ -1910,38 +2079,42 @@ class ModernDownloader:
             text_color=COLORS["text_primary"],
             corner_radius=10,
             height=40,
-            command=dialog.destroy,
+            command=self._hide_supported_platforms,
         )
         close_btn.pack(fill="x", padx=20, pady=(10, 20))
+        dialog.protocol("WM_DELETE_WINDOW", self._hide_supported_platforms)
+
+    def _hide_supported_platforms(self):
+        """Hide (not destroy) the platforms dialog so reopening is instant"""
+        dialog = self._platforms_dialog
+        if dialog is not None:
+            dialog.grab_release()
+            dialog.withdraw()
+            self._wheel_target = None  # its scroll frame may still be the target
 
     # =================================================================
     # PREVIEW
     # =================================================================
     def _preview_loading(self):
         """Show loading state"""
-        self.preview_text.configure(state="normal")
-        self.preview_text.delete("1.0", "end")
-        self.preview_text.insert("end", "Loading preview...")
-        self.preview_text.configure(state="disabled")
+        self._set_preview_text("Loading preview...")
         self.song_count.configure(text="Loading...")
         self.preview_title.configure(text=f"{ICONS['preview']} Preview (Loading...)")
 
     def _is_playlist_url(self, url: str) -> bool:
         """Detect if URL is a playlist based on patterns"""
-        url_lower = url.lower()
-        # YouTube playlist patterns
-        if any(pattern in url_lower for pattern in ["playlist?list=", "/playlist/"]):
-            return True
-        # YouTube Music playlist/album
-        if "music.youtube.com" in url_lower and "list=" in url_lower:
-            return True
-        # SoundCloud sets/playlists
-        if "soundcloud.com" in url_lower and "/sets/" in url_lower:
-            return True
-        # Bandcamp albums
-        if "bandcamp.com" in url_lower and "/album/" in url_lower:
-            return True
-        return False
+        return is_playlist_url(url)
+
+    def _resolve_preview_entry(self, entry: Dict, options: Mapping) -> Dict:
+        """Fully extract a lone flat entry so its preview shows duration/channel"""
+        entry_url = entry.get("url") or entry.get("webpage_url")
+        if not entry_url or entry.get("duration"):
+            return entry
+        try:
+            with self._ydl_pool.lease(options) as ydl:
+                return ydl.extract_info(entry_url, download=False) or entry
+        except Exception:
+            return entry
 
     def _fetch_info(self, url: str):
         """Fetch video info in background with retry"""
@@ -1950,28 +2123,17 @@ class ModernDownloader:
             return
 
         # Read Tk state while still on the main thread.
-        limit = self._get_limit()
+        preview_opts = build_preview_options(self._get_limit())
+        self._fetch_cancel.set()
+        cancel = self._fetch_cancel = threading.Event()
 
         def fetch():
             for attempt in range(MAX_RETRIES):
+                if cancel.is_set():
+                    return
                 try:
-                    yt_dlp = get_yt_dlp()
-
-                    ydl_opts = {
-                        "quiet": True,
-                        "no_warnings": True,
-                        "extract_flat": True,
-                        "playlistend": limit or 500,
-                        # Add socket timeout for better stability
-                        "socket_timeout": 30,
-                        # Add retries
-                        "retries": 3,
-                        "file_access_retries": 3,
-                        # Fragment retries for HLS/DASH
-                        "fragment_retries": 3,
-                    }
-
-                    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                    # Previews reuse a pooled YoutubeDL for the same options
+                    with self._ydl_pool.lease(preview_opts) as ydl:
                         info = ydl.extract_info(url, download=False)
 
                     if info is None:
@@ -2001,36 +2163,30 @@ class ModernDownloader:
                         )
 
                         # Auto-update the playlist switch
-                        def update_playlist_switch(is_pl):
-                            self.playlist_var.set(is_pl)
-                            if is_pl:
-                                self.playlist_switch.configure(state="normal")
-                            else:
-                                self.playlist_switch.configure(state="disabled")
-
-                        self._call_ui(lambda p=is_playlist: update_playlist_switch(p))
+                        self._call_ui(partial(self._set_playlist_switch, is_playlist))
 
                         if entry_count == 1 and not is_playlist_url:
                             # Single video treated as playlist due to URL structure - show as single
                             self.entries_list = entries
-                            self._call_ui(
-                                lambda item=entries[0]: self._update_single_preview(item)
+                            entry = self._resolve_preview_entry(
+                                entries[0], preview_opts
                             )
+                            self._call_ui(partial(self._update_single_preview, entry))
                             title = (
-                                entries[0].get("title")
-                                or entries[0].get("uploader")
-                                or "Unknown"
+                                entry.get("title") or entry.get("uploader") or "Unknown"
                             )
                             self.log(
                                 f"Found: {truncate(title, 40)}",
                                 "success",
                             )
                         else:
-                            # True playlist or URL indicates playlist
+                            # True playlist or URL indicates playlist; format
+                            # the text here so the UI thread only inserts it
+                            preview = _format_playlist_preview(
+                                entries, info.get("title", "Playlist")
+                            )
                             self._call_ui(
-                                lambda: self._update_preview_list(
-                                    entries, info.get("title", "Playlist")
-                                ),
+                                partial(self._update_preview_list, preview, entry_count)
                             )
                             self.log(
                                 f"Found {entry_count} tracks: {truncate(info.get('title', ''), 40)}",
@@ -2038,16 +2194,11 @@ class ModernDownloader:
                             )
                     else:
                         # Single video
-                        self._call_ui(
-                            lambda: [
-                                self.playlist_var.set(False),
-                                self.playlist_switch.configure(state="disabled"),
-                            ],
-                        )
+                        self._call_ui(partial(self._set_playlist_switch, False))
                         self.entries_list = [info]
-                        self._call_ui(lambda: self._update_single_preview(info))
+                        self._call_ui(partial(self._update_single_preview, info))
                         title = info.get("title") or info.get("uploader") or "Unknown"
-                        if title == "Unknown" and "facebook" in url.lower():
+                        if title == "Unknown" and detect_platform(url) == "Facebook":
                             title = "Facebook Video (preview limited)"
                         self.log(
                             f"Found: {truncate(title, 40)}",
@@ -2061,19 +2212,20 @@ class ModernDownloader:
                     if url != self.last_url or self._is_closing:
                         return
                     error = str(e)
-                    if "DRM" in error.upper():
+                    err_lower = error.lower()
+                    platform_name = detect_platform(url)
+                    if "drm" in err_lower:
                         self._call_ui(self._show_drm_message)
                         break
-                    elif "private video" in error.lower():
-                        is_yt = "youtube" in url.lower() or "youtu.be" in url.lower()
-                        platform = "YouTube" if is_yt else "Platform"
-                        self.log(f"Private video - cannot download", "error")
-                        self._call_ui(
-                            lambda: self._preview_private(platform.lower())
+                    elif "private video" in err_lower:
+                        platform = (
+                            "YouTube" if platform_name == "YouTube" else "Platform"
                         )
+                        self.log(f"Private video - cannot download", "error")
+                        self._call_ui(partial(self._preview_private, platform.lower()))
                         break
-                    elif "facebook" in url.lower() and (
-                        "login" in error.lower() or "cookie" in error.lower()
+                    elif platform_name == "Facebook" and (
+                        "login" in err_lower or "cookie" in err_lower
                     ):
                         self.log(
                             "Facebook requires login - try downloading directly",
@@ -2082,58 +2234,52 @@ class ModernDownloader:
                         self._call_ui(self._preview_facebook_login)
                         break
                     elif attempt < MAX_RETRIES - 1:
-                        # Retry with backoff
-                        delay = min(RETRY_DELAY_BASE * (2**attempt), RETRY_MAX_DELAY)
+                        # Retry with jittered backoff, like download retries
+                        delay = backoff_delay(attempt)
                         self.log(
-                            f"Fetch failed, retrying in {delay}s... ({attempt+1}/{MAX_RETRIES})",
+                            f"Fetch failed, retrying in {delay:.1f}s... ({attempt+1}/{MAX_RETRIES})",
                             "warning",
                         )
-                        time.sleep(delay)
+                        if cancel.wait(delay):
+                            return
                     else:
                         self.log(f"Fetch failed: {truncate(error, 60)}", "error")
                         self._call_ui(self._preview_error)
 
         threading.Thread(target=fetch, daemon=True).start()
 
-    def _update_preview_list(self, entries: List[Dict], title: str):
-        """Update preview with playlist"""
+    def _set_playlist_switch(self, is_playlist: bool):
+        """Match the playlist switch to what the preview found"""
+        self.playlist_var.set(is_playlist)
+        self.playlist_switch.configure(state="normal" if is_playlist else "disabled")
+
+    def _set_preview_text(self, text: str):
+        """Replace the read-only preview contents with a single insert"""
         self.preview_text.configure(state="normal")
         self.preview_text.delete("1.0", "end")
+        self.preview_text.insert("end", text)
+        self.preview_text.configure(state="disabled")
 
-        title = sanitize_text(title)
-        self.preview_text.insert("end", f"{ICONS['music']} {title}\n")
-        self.preview_text.insert("end", "─" * 45 + "\n\n")
-
-        for i, entry in enumerate(entries[:50], 1):
-            name = (
-                entry.get("title", "Unknown") if isinstance(entry, dict) else str(entry)
-            )
-            name = sanitize_text(name)
-            self.preview_text.insert("end", f"{i:2d}. {truncate(name, 55)}\n")
-
-        if len(entries) > 50:
-            self.preview_text.insert("end", f"\n... and {len(entries) - 50} more ...")
+    def _update_preview_list(self, preview: str, count: int):
+        """Update preview with playlist text formatted by the fetch worker"""
+        self._set_preview_text(preview)
 
-        self.preview_text.configure(state="disabled")
-        self.song_count.configure(text=f"{len(entries)} tracks")
+        self.song_count.configure(text=f"{count} tracks")
         self.preview_title.configure(text=f"{ICONS['preview']} Preview")
         self.progress_status.configure(
-            text=f"Ready to download {len(entries)} tracks",
+            text=f"Ready to download {count} tracks",
             text_color=COLORS["text_secondary"],
         )
 
     def _update_single_preview(self, info: Dict):
         """Update preview with single video"""
-        self.preview_text.configure(state="normal")
-        self.preview_text.delete("1.0", "end")
-
         title = sanitize_text(info.get("title") or info.get("uploader") or "Unknown")
         duration = info.get("duration", 0)
         uploader = sanitize_text(info.get("uploader", "Unknown"))
         url = info.get("webpage_url", "")
 
         # Special handling for Facebook when title is not available
-        if title == "Unknown" and "facebook" in url.lower():
+        if title == "Unknown" and detect_platform(url) == "Facebook":
             title = "Facebook Video"
             uploader = "Facebook User"
 
@@ -2141,10 +2287,9 @@ class ModernDownloader:
             f"{int(duration) // 60}:{int(duration) % 60:02d}" if duration else "--:--"
         )
 
-        self.preview_text.insert("end", f"{ICONS['music']} {title}\n\n")
-        self.preview_text.insert("end", f"Channel: {uploader}\n")
-        self.preview_text.insert("end", f"Duration: {dur_str}")
-        self.preview_text.configure(state="disabled")
+        self._set_preview_text(
+            f"{ICONS['music']} {title}\n\nChannel: {uploader}\nDuration: {dur_str}"
+        )
 
         self.song_count.configure(text="1 track")
         self.preview_title.configure(text=f"{ICONS['preview']} Preview")
@@ -2154,66 +2299,54 @@ class ModernDownloader:
 
     def _show_drm_message(self):
         """Show DRM warning"""
-        self.preview_text.configure(state="normal")
-        self.preview_text.delete("1.0", "end")
-        self.preview_text.insert("end", f"{ICONS['warning']} DRM Protected Content\n\n")
-        self.preview_text.insert("end", "This platform uses DRM encryption.\n")
-        self.preview_text.insert("end", "Try: YouTube, SoundCloud, Bandcamp")
-        self.preview_text.configure(state="disabled")
+        self._set_preview_text(
+            f"{ICONS['warning']} DRM Protected Content\n\n"
+            "This platform uses DRM encryption.\n"
+            "Try: YouTube, SoundCloud, Bandcamp"
+        )
         self.song_count.configure(text="Not supported")
         self.preview_title.configure(text=f"{ICONS['preview']} Preview (DRM)")
         self.log("DRM platform detected - Not supported", "error")
 
     def _preview_private(self, platform=""):
         """Show private video message"""
-        self.preview_text.configure(state="normal")
-        self.preview_text.delete("1.0", "end")
-        self.preview_text.insert("end", f"{ICONS['warning']} Private Video\n\n")
-        self.preview_text.insert("end", f"This {platform or 'video'} is private.\n")
-        self.preview_text.insert("end", "Private videos cannot be downloaded.")
-        self.preview_text.configure(state="disabled")
+        self._set_preview_text(
+            f"{ICONS['warning']} Private Video\n\n"
+            f"This {platform or 'video'} is private.\n"
+            "Private videos cannot be downloaded."
+        )
         self.song_count.configure(text="Private")
         self.preview_title.configure(text=f"{ICONS['preview']} Preview (Private)")
 
     def _preview_error(self):
         """Show error state"""
-        self.preview_text.configure(state="normal")
-        self.preview_text.delete("1.0", "end")
-        self.preview_text.insert("end", "Failed to load preview.\n")
-        self.preview_text.insert("end", "Check URL and try again.")
-        self.preview_text.configure(state="disabled")
+        self._set_preview_text("Failed to load preview.\nCheck URL and try again.")
         self.song_count.configure(text="Error")
         self.preview_title.configure(text=f"{ICONS['preview']} Preview")
 
     def _preview_facebook_login(self):
         """Show Facebook login warning"""
-        self.preview_text.configure(state="normal")
-        self.preview_text.delete("1.0", "end")
-        self.preview_text.insert(
-            "end", f"{ICONS['warning']} Facebook Login Required\n\n"
+        self._set_preview_text(
+            f"{ICONS['warning']} Facebook Login Required\n\n"
+            "Facebook Reels/Videos require login.\n"
+            "You can still try downloading - it may work.\n\n"
+            "Alternative: Use public Facebook video URLs"
         )
-        self.preview_text.insert("end", "Facebook Reels/Videos require login.\n")
-        self.preview_text.insert(
-            "end", "You can still try downloading - it may work.\n\n"
-        )
-        self.preview_text.insert("end", "Alternative: Use public Facebook video URLs")
-        self.preview_text.configure(state="disabled")
         self.song_count.configure(text="Login required")
         self.preview_title.configure(text=f"{ICONS['preview']} Preview (Facebook)")
 
     def _clear_all(self):
         """Clear all fields"""
         self.url_entry.delete(0, "end")
-        self.preview_text.configure(state="normal")
-        self.preview_text.delete("1.0", "end")
-        self.preview_text.insert("end", "Paste a URL to see track list...")
-        self.preview_text.configure(state="disabled")
+        self._set_preview_text("Paste a URL to see track list...")
         self.song_count.configure(text="0 tracks")
         self.platform_label.configure(text="")
         self.preview_title.configure(text=f"{ICONS['preview']} Preview")
         self.video_info = None
         self.entries_list = []
         self.last_url = ""
+        self._fetch_cancel.set()
+        self._progress_shown = None
         self.progress_bar.set(0)
         self.progress_status.configure(text="Ready to download")
         self.progress_percent.configure(text="0%")
@@ -2223,25 +2356,31 @@ class ModernDownloader:
         self.playlist_var.set(True)
         self.playlist_switch.configure(state="normal")
 
+    def _on_limit_changed(self, *_):
+        """Mirror the limit entry into an int so readers skip the Tcl round-trip."""
+        self._playlist_limit = _limit_from_text(self.limit_var.get())
+
     def _get_limit(self) -> Optional[int]:
-        """Get playlist limit"""
-        try:
-            limit = int(self.limit_var.get())
-            return limit if limit > 0 else None
-        except (ValueError, TypeError):
-            return 50
+        """Get playlist limit (0 means no limit)."""
+        limit = self._playlist_limit
+        return limit if limit > 0 else None
+
+    def _refresh_save_label(self):
+        """Show the current download path, touching Tk only when it changed"""
+        text = truncate(self.download_path, _SAVE_LABEL_WIDTH)
+        if self.save_label.cget("text") != text:
+            self.save_label.configure(text=text)
 
     def _change_folder(self):
         """Change download folder"""
         try:
-            from tkinter import filedialog
-
             folder = filedialog.askdirectory(initialdir=self.download_path)
             if folder:
                 self.download_path = folder
-                self.save_label.configure(text=truncate(folder, 35))
+                self._download_path_ready = False
+                self._refresh_save_label()
                 self.log("Save folder updated", "info")
-                self._save_settings()  # Auto-save when folder changes
+                self._schedule_settings_flush()  # Auto-save when folder changes
         except Exception:
             self.log("Folder change failed", "error")
 
@@ -2282,7 +2421,14 @@ class ModernDownloader:
         self._save_collapse_state()
 
     def _save_collapse_state(self):
-        """Save collapse state to settings file"""
+        """Write the collapse state once toggling settles"""
+        if self._collapse_flush_job is not None:
+            self.window.after_cancel(self._collapse_flush_job)
+        self._collapse_flush_job = self.window.after(500, self._flush_collapse_state)
+
+    def _flush_collapse_state(self):
+        """Save only the collapse key, silently, leaving other edits unsaved"""
+        self._collapse_flush_job = None
         try:
             self.settings_repository.update(
                 {"settings_collapsed": self.settings_collapsed}
@@ -2290,33 +2436,18 @@ class ModernDownloader:
         except Exception:
             pass
 
-    def _load_collapse_state(self):
-        """Load collapse state from settings"""
-        try:
-            # Ensure UI elements exist
-            if not hasattr(self, "settings_content_frame") or not hasattr(
-                self, "settings_toggle_icon"
-            ):
-                return
-
-            if self.settings_file.exists():
-                settings = self.settings_repository.load()
-
-                if settings.get("settings_collapsed", False):
-                    # Apply collapsed state
-                    self.settings_content_frame.pack_forget()
-                    self.settings_toggle_icon.configure(text="▶")
-                    if hasattr(self, "settings_hint_label"):
-                        self.settings_hint_label.configure(text="(Click to expand)")
-                    self.settings_collapsed = True
-        except Exception:
-            pass
+    def _load_collapse_state(self, settings: Dict[str, Any]):
+        """Apply the saved collapse state from already-loaded settings"""
+        if settings.get("settings_collapsed", False):
+            self.settings_content_frame.pack_forget()
+            self.settings_toggle_icon.configure(text="▶")
+            self.settings_hint_label.configure(text="(Click to expand)")
+            self.settings_collapsed = True
 
     def _open_folder(self):
         """Open download folder"""
         try:
-            if not Path(self.download_path).exists():
-                os.makedirs(self.download_path)
+            os.makedirs(self.download_path, exist_ok=True)
             if sys.platform == "win32":
                 os.startfile(self.download_path)
             elif sys.platform == "darwin":
@@ -2349,7 +2480,7 @@ class ModernDownloader:
         """Build yt-dlp options through the UI-independent option builder."""
         return build_ydl_options(
             download_path=self.download_path,
-            progress_hook=self._progress_hook,
+            progress_hook=self._dispatch_progress,
             download_type=download_type,
             audio_format=fmt,
             quality=quality,
@@ -2366,68 +2497,11 @@ class ModernDownloader:
             source_url=source_url,
         )
 
-    def _progress_hook(self, d: Dict):
-        """Download progress callback with speed calculation"""
-        if self._cancel_event.is_set() or not self.is_downloading:
-            return
-
-        if d["status"] == "downloading":
-            # Calculate current file progress
-            current_progress = 0.0
-            downloaded_bytes = d.get("downloaded_bytes", 0)
-
-            if d.get("total_bytes"):
-                current_progress = downloaded_bytes / d["total_bytes"]
-                total_bytes = d["total_bytes"]
-            elif d.get("total_bytes_estimate"):
-                current_progress = downloaded_bytes / d["total_bytes_estimate"]
-                total_bytes = d["total_bytes_estimate"]
-            elif d.get("fragment_index") and d.get("fragment_count"):
-                current_progress = d["fragment_index"] / d["fragment_count"]
-                total_bytes = 0
-            else:
-                total_bytes = 0
-
-            self._current_file_progress = current_progress
-
-            # Calculate speed
-            current_time = time.time()
-            if current_time - self._last_progress_time >= self._speed_update_interval:
-                if self._last_progress_time > 0:
-                    bytes_diff = downloaded_bytes - self._last_progress_bytes
-                    time_diff = current_time - self._last_progress_time
-                    if time_diff > 0:
-                        self._download_speed = bytes_diff / time_diff
-                self._last_progress_time = current_time
-                self._last_progress_bytes = downloaded_bytes
-
-            # Calculate overall progress
-            total = max(self.total_items, 1)
-            overall = min((self.downloaded_count + current_progress) / total, 1.0)
-
-            # Calculate ETA
-            eta_str = ""
-            if self._download_speed > 0 and total_bytes > 0:
-                remaining_bytes = total_bytes - downloaded_bytes
-                eta_seconds = remaining_bytes / self._download_speed
-                if eta_seconds < 60:
-                    eta_str = f"{int(eta_seconds)}s"
-                elif eta_seconds < 3600:
-                    eta_str = f"{int(eta_seconds/60)}m {int(eta_seconds%60)}s"
-                else:
-                    eta_str = f"{int(eta_seconds/3600)}h {int((eta_seconds%3600)/60)}m"
-
-            # Schedule UI update
-            self._call_ui(
-                lambda p=overall, s=self._download_speed, e=eta_str: self._update_progress_with_speed(
-                    p, s, e
-                ),
-            )
-
-        elif d["status"] == "finished":
-            # A video can emit this event once for video and once for audio.
-            # Count completion only after ydl.download() returns successfully.
-            self._current_file_progress = 0.0
+    def _dispatch_progress(self, d: Dict):
+        """Forward a pooled YoutubeDL's progress event to the current item."""
+        hook = getattr(self._progress_local, "hook", None)
+        if hook is not None:
+            hook(d)
 
     def _update_progress_with_speed(self, percent: float, speed: float, eta: str):
         """Update progress with speed display"""
@@ -2442,38 +2516,34 @@ class ModernDownloader:
         """Update progress bar and label with visual effects"""
         try:
             percent = max(0.0, min(1.0, float(percent)))
+            bucket = 2 if percent >= 1.0 else 1 if percent >= 0.5 else 0
+            shown = (bucket, round(percent * 100))
+            previous = self._progress_shown
+            if shown == previous:
+                return  # Same percent and color as the last redraw
+            self._progress_shown = shown
 
             self.progress_bar.set(percent)
-            self.progress_percent.configure(text=f"{percent*100:.0f}%")
-
-            # Change color based on progress
-            if percent >= 1.0:
-                self.progress_bar.configure(progress_color=COLORS["success"])
-                self.progress_percent.configure(text_color=COLORS["success"])
-            elif percent >= 0.5:
-                self.progress_bar.configure(progress_color=COLORS["accent"])
-                self.progress_percent.configure(text_color=COLORS["accent"])
-            else:
-                self.progress_bar.configure(progress_color=COLORS["warning"])
-                self.progress_percent.configure(text_color=COLORS["warning"])
+            self.progress_percent.configure(text=f"{shown[1]}%")
+
+            # Change color based on progress, only when the bucket changes
+            if previous is None or previous[0] != bucket:
+                color = COLORS[("warning", "accent", "success")[bucket]]
+                self.progress_bar.configure(progress_color=color)
+                self.progress_percent.configure(text_color=color)
 
         except Exception:
             pass
 
     def _download_tiktok_subprocess(
-        self, item: DownloadItem, ydl_opts: Dict, total: int
+        self, item: DownloadItem, ydl_opts: Mapping[str, Any]
     ) -> bool:
         """Download TikTok without blocking on a full stdout/stderr pipe."""
+        session = self.current_session
         item_url = item.url
         item_index = item.index
-        venv_exe = Path(sys.executable).parent / ("yt-dlp.exe" if sys.platform == "win32" else "yt-dlp")
-        if venv_exe.exists():
-            command_prefix = [str(venv_exe)]
-        elif shutil.which("yt-dlp"):
-            command_prefix = [shutil.which("yt-dlp")]
-        elif not getattr(sys, "frozen", False):
-            command_prefix = [sys.executable, "-m", "yt_dlp"]
-        else:
+        command_prefix = _yt_dlp_command()
+        if command_prefix is None:
             # A one-file build contains the Python package but not the console
             # script. Use the bundled API so TikTok still works in the EXE.
             def api_progress_hook(d: Dict):
@@ -2486,25 +2556,23 @@ class ModernDownloader:
                     )
                     if expected:
                         percent = downloaded / expected
-                        with self._download_lock:
-                            item.progress = min(max(percent, 0.0), 1.0)
-                            overall = (
-                                self.current_session.progress
-                                if self.current_session
-                                else item.progress / total
-                            )
-                        self._call_ui(
-                            lambda p=min(overall, 1.0): self._update_progress(p)
-                        )
+                        overall = session.set_progress(item, percent)
+                        self._post_progress(overall)
 
             try:
+                # impersonate is part of the pool key, so these instances never
+                # serve non-TikTok items.
                 api_opts = {
                     **ydl_opts,
                     "impersonate": "chrome",
-                    "progress_hooks": [api_progress_hook],
+                    "progress_hooks": [self._dispatch_progress],
                 }
-                with get_yt_dlp().YoutubeDL(api_opts) as ydl:
-                    return ydl.download([item_url]) == 0
+                self._progress_local.hook = api_progress_hook
+                try:
+                    with self._ydl_pool.lease(api_opts) as ydl:
+                        return ydl.download([item_url]) == 0
+                finally:
+                    self._progress_local.hook = None
             except Exception as e:
                 if not self._cancel_event.is_set():
                     self.log(f"TikTok error: {truncate(str(e), 50)}", "error")
@@ -2513,7 +2581,7 @@ class ModernDownloader:
         for attempt in range(MAX_RETRIES):
             process: Optional[subprocess.Popen] = None
             try:
-                cmd = command_prefix + build_tiktok_cli_options(ydl_opts)
+                cmd = [*command_prefix, *build_tiktok_cli_options(ydl_opts)]
                 cmd.append(item_url)
 
                 process = subprocess.Popen(
@@ -2529,7 +2597,7 @@ class ModernDownloader:
                 with self._download_lock:
                     self._active_processes.add(process)
 
-                output_queue: queue.Queue = queue.Queue()
+                output_queue: queue.SimpleQueue = queue.SimpleQueue()
 
                 def read_output():
                     if process and process.stdout:
@@ -2538,41 +2606,41 @@ class ModernDownloader:
 
                 threading.Thread(target=read_output, daemon=True).start()
 
-                # Monitor progress with timeout
-                start_time = time.time()
-                output_lines: List[str] = []
+                # Monitor progress with timeout; only the tail is ever reported
+                deadline = time.monotonic() + DOWNLOAD_TIMEOUT
+                output_lines: deque = deque(maxlen=20)
                 while process.poll() is None:
                     if self._cancel_event.is_set() or not self.is_downloading:
                         process.terminate()
                         return False
 
                     # Check timeout
-                    if time.time() - start_time > DOWNLOAD_TIMEOUT:
+                    if time.monotonic() > deadline:
                         process.terminate()
                         self.log(f"Download timeout for item {item_index}", "warning")
                         return False
 
                     try:
-                        line = output_queue.get(timeout=0.2)
+                        lines = [output_queue.get(timeout=0.1)]
                     except queue.Empty:
                         continue
-                    output_lines.append(line.rstrip())
-
-                    # Parse progress
-                    if "download" in line.lower() and "%" in line:
-                        match = re.search(r"(\d+\.?\d*)%", line)
-                        if match:
-                            percent = float(match.group(1)) / 100
-                            with self._download_lock:
-                                item.progress = min(max(percent, 0.0), 1.0)
-                                overall = (
-                                    self.current_session.progress
-                                    if self.current_session
-                                    else item.progress / total
-                                )
-                            self._call_ui(
-                                lambda p=min(overall, 1.0): self._update_progress(p)
-                            )
+                    # Take everything already buffered; only the newest
+                    # percentage matters for the progress bar.
+                    while True:
+                        try:
+                            lines.append(output_queue.get_nowait())
+                        except queue.Empty:
+                            break
+                    output_lines.extend(line.rstrip() for line in lines)
+
+                    for line in reversed(lines):
+                        if "%" in line and "download" in line.lower():
+                            match = _PROGRESS_PATTERN.search(line)
+                            if match:
+                                percent = float(match.group(1)) / 100
+                                overall = session.set_progress(item, percent)
+                                self._post_progress(overall)
+                                break
 
                 while not output_queue.empty():
                     output_lines.append(output_queue.get_nowait().rstrip())
@@ -2580,14 +2648,14 @@ class ModernDownloader:
                 if process.returncode == 0:
                     return True
                 else:
-                    error_msg = "\n".join(output_lines[-20:]) or "Unknown error"
+                    error_msg = "\n".join(output_lines) or "Unknown error"
                     if "ip address is blocked" in error_msg.lower():
                         self.log("TikTok blocked your IP. Try VPN.", "error")
                         return False
                     elif attempt < MAX_RETRIES - 1:
-                        delay = min(RETRY_DELAY_BASE * (2**attempt), RETRY_MAX_DELAY)
+                        delay = backoff_delay(attempt)
                         self.log(
-                            f"TikTok retry {attempt+1}/{MAX_RETRIES} in {delay}s...",
+                            f"TikTok retry {attempt+1}/{MAX_RETRIES} in {delay:.1f}s...",
                             "warning",
                         )
                         if self._cancel_event.wait(delay):
@@ -2600,7 +2668,7 @@ class ModernDownloader:
                 if self._cancel_event.is_set():
                     return False
                 if attempt < MAX_RETRIES - 1:
-                    delay = min(RETRY_DELAY_BASE * (2**attempt), RETRY_MAX_DELAY)
+                    delay = backoff_delay(attempt)
                     if self._cancel_event.wait(delay):
                         return False
                 else:
@@ -2623,65 +2691,81 @@ class ModernDownloader:
         return False
 
     def _download_single_item(
-        self, item: DownloadItem, ydl_opts: Dict, total: int
+        self, item: DownloadItem, ydl_opts: Mapping[str, Any]
     ) -> bool:
         """Download a single item with retry logic"""
-        item.status = DownloadStatus.DOWNLOADING
+        session = self.current_session
+        session.set_status(item, DownloadStatus.DOWNLOADING)
         item.start_time = time.time()
 
         def mark_completed() -> bool:
-            item.status = DownloadStatus.COMPLETED
-            item.progress = 1.0
+            session.set_status(item, DownloadStatus.COMPLETED)
+            overall = session.set_progress(item, 1.0)
+            session.clear_forbidden()
             item.end_time = time.time()
-            with self._download_lock:
-                self._downloaded_items += 1
-                self.downloaded_count = self._downloaded_items
-            self._call_ui(self._update_stats)
+            self.downloaded_count = session.completed_count
+            # The throttled hook usually drops the final tick; post it here
+            self._post_progress(overall)
+            self._post_stats()
             return True
 
         for attempt in range(MAX_RETRIES):
             if self._cancel_event.is_set() or not self.is_downloading:
-                item.status = DownloadStatus.CANCELLED
+                session.set_status(item, DownloadStatus.CANCELLED)
                 return False
 
             try:
-                is_tiktok = "tiktok.com" in item.url.lower()
-
-                if is_tiktok:
-                    success = self._download_tiktok_subprocess(
-                        item, ydl_opts, total
-                    )
+                if item.platform == "TikTok":
+                    success = self._download_tiktok_subprocess(item, ydl_opts)
                     if success:
                         return mark_completed()
                     if self._cancel_event.is_set() or not self.is_downloading:
-                        item.status = DownloadStatus.CANCELLED
+                        session.set_status(item, DownloadStatus.CANCELLED)
                         item.end_time = time.time()
                         return False
                     # The CLI path already performs MAX_RETRIES attempts. Frozen
                     # builds use the API path, so retain the outer retry there.
                     if getattr(sys, "frozen", False) and attempt < MAX_RETRIES - 1:
-                        delay = min(
-                            RETRY_DELAY_BASE * (2**attempt), RETRY_MAX_DELAY
-                        )
+                        delay = backoff_delay(attempt)
                         self.log(
-                            f"TikTok retry {attempt + 1}/{MAX_RETRIES} in {delay}s...",
+                            f"TikTok retry {attempt + 1}/{MAX_RETRIES} in {delay:.1f}s...",
                             "warning",
                         )
                         if self._cancel_event.wait(delay):
-                            item.status = DownloadStatus.CANCELLED
+                            session.set_status(item, DownloadStatus.CANCELLED)
                             return False
                         continue
-                    item.status = DownloadStatus.FAILED
+                    session.set_status(item, DownloadStatus.FAILED)
                     item.error_message = "TikTok download failed"
                     break
 
-                yt_dlp = get_yt_dlp()
-
                 # Create item-specific progress hook
+                controller = self._concurrency
+                received = None
+                reported_bytes = 0
+                reported_at = 0.0
+
                 def item_progress_hook(d):
+                    nonlocal received, reported_bytes, reported_at
                     if self._cancel_event.is_set() or not self.is_downloading:
                         raise RuntimeError("Download cancelled")
                     if d.get("status") == "downloading":
+                        downloaded = d.get("downloaded_bytes") or 0
+                        if controller is not None:
+                            # Feed Auto mode the bytes received since the last tick
+                            if received is not None:
+                                controller.add_bytes(downloaded - received)
+                            received = downloaded
+                        # yt-dlp calls this for every chunk; report at most once
+                        # per PROGRESS_MIN_BYTES or PROGRESS_MIN_INTERVAL.
+                        now = time.monotonic()
+                        if (
+                            downloaded - reported_bytes < PROGRESS_MIN_BYTES
+                            and now - reported_at < PROGRESS_MIN_INTERVAL
+                        ):
+                            return
+                        reported_bytes = downloaded
+                        reported_at = now
                         if d.get("total_bytes"):
                             item_progress = d["downloaded_bytes"] / d["total_bytes"]
                         elif d.get("total_bytes_estimate"):
@@ -2694,23 +2778,16 @@ class ModernDownloader:
                         speed = float(d.get("speed") or 0.0)
                         eta_seconds = d.get("eta")
                         eta = format_eta(eta_seconds)
-                        with self._download_lock:
-                            item.progress = min(max(item_progress, 0.0), 1.0)
-                            overall = (
-                                self.current_session.progress
-                                if self.current_session
-                                else item.progress / total
-                            )
-                        self._call_ui(
-                            lambda p=overall, s=speed, e=eta: self._update_progress_with_speed(
-                                p, s, e
-                            )
-                        )
-
-                item_opts = {**ydl_opts, "progress_hooks": [item_progress_hook]}
+                        overall = session.set_progress(item, item_progress)
+                        self._post_progress(overall, speed, eta)
 
-                with yt_dlp.YoutubeDL(item_opts) as ydl:
-                    error = ydl.download([item.url])
+                # ydl_opts already routes progress through _dispatch_progress
+                self._progress_local.hook = item_progress_hook
+                try:
+                    with self._ydl_pool.lease(ydl_opts) as ydl:
+                        error = ydl.download([item.url])
+                finally:
+                    self._progress_local.hook = None
 
                 if error == 0:
                     return mark_completed()
@@ -2719,51 +2796,49 @@ class ModernDownloader:
 
             except Exception as e:
                 if self._cancel_event.is_set() or not self.is_downloading:
-                    item.status = DownloadStatus.CANCELLED
+                    session.set_status(item, DownloadStatus.CANCELLED)
                     item.end_time = time.time()
                     return False
                 error_msg = str(e)
                 item.retry_count += 1
 
                 # Check for specific errors
-                is_youtube = (
-                    "youtube" in item.url.lower() or "youtu.be" in item.url.lower()
-                )
-
-                if is_youtube and "private video" in error_msg.lower():
+                if item.platform == "YouTube" and "private video" in error_msg.lower():
                     self.log(f"Private video: {item.index}", "error")
-                    item.status = DownloadStatus.FAILED
+                    session.set_status(item, DownloadStatus.FAILED)
                     item.error_message = "Private video"
                     break
                 elif "403" in error_msg or "Forbidden" in error_msg:
-                    if attempt < MAX_RETRIES - 1:
-                        delay = min(RETRY_DELAY_BASE * (2**attempt), RETRY_MAX_DELAY)
+                    # Retrying is pointless once the host keeps refusing items
+                    blocked = session.forbidden_streak >= FORBIDDEN_STREAK_LIMIT
+                    if attempt < MAX_RETRIES - 1 and not blocked:
+                        delay = backoff_delay(attempt)
                         self.log(
-                            f"Retry {item.index} in {delay}s (403 Forbidden)", "warning"
+                            f"Retry {item.index} in {delay:.1f}s (403 Forbidden)", "warning"
                         )
                         if self._cancel_event.wait(delay):
-                            item.status = DownloadStatus.CANCELLED
+                            session.set_status(item, DownloadStatus.CANCELLED)
                             return False
                     else:
-                        item.status = DownloadStatus.FAILED
+                        session.set_status(item, DownloadStatus.FAILED)
                         item.error_message = "403 Forbidden"
+                        session.record_forbidden()
+                        break
                 elif attempt < MAX_RETRIES - 1:
-                    delay = min(RETRY_DELAY_BASE * (2**attempt), RETRY_MAX_DELAY)
-                    self.log(f"Retry {item.index} in {delay}s...", "warning")
+                    delay = backoff_delay(attempt)
+                    self.log(f"Retry {item.index} in {delay:.1f}s...", "warning")
                     if self._cancel_event.wait(delay):
-                        item.status = DownloadStatus.CANCELLED
+                        session.set_status(item, DownloadStatus.CANCELLED)
                         return False
                 else:
-                    item.status = DownloadStatus.FAILED
+                    session.set_status(item, DownloadStatus.FAILED)
                     item.error_message = error_msg[:100]
 
         if item.status != DownloadStatus.CANCELLED:
-            item.status = DownloadStatus.FAILED
+            session.set_status(item, DownloadStatus.FAILED)
             item.end_time = time.time()
-            with self._download_lock:
-                self._failed_items += 1
-                self.failed_count = self._failed_items
-            self._call_ui(self._update_stats)
+            self.failed_count = session.failed_count
+            self._post_stats()
         return False
 
     def _download(self, request: DownloadRequest):
@@ -2783,6 +2858,7 @@ class ModernDownloader:
         is_playlist = request.is_playlist
         limit = request.limit
         concurrent = request.concurrent
+        concurrent_label = "Auto" if request.auto_concurrency else concurrent
         video_info = request.video_info
         entries_list = request.entries
 
@@ -2796,17 +2872,11 @@ class ModernDownloader:
 
         self.downloaded_count = 0
         self.failed_count = 0
-        self._downloaded_items = 0
-        self._failed_items = 0
-        self._current_file_progress = 0.0
-        self._download_speed = 0.0
-        self._last_progress_time = 0.0
-        self._last_progress_bytes = 0
         self.total_items = 1
         self._download_futures = []
 
         try:
-            yt_dlp = get_yt_dlp()
+            get_yt_dlp()  # Fail the session up front if yt-dlp cannot load
 
             # Get list of URLs to download
             download_items: List[DownloadItem] = []
@@ -2815,38 +2885,15 @@ class ModernDownloader:
                 download_items = [DownloadItem(url=url, index=1, title=title)]
                 self.total_items = 1
             elif entries_list:
-                selected_entries = entries_list[:limit] if limit else entries_list
-                for i, e in enumerate(selected_entries, 1):
-                    if e:
-                        item_url = e.get("webpage_url") or e.get("url", "")
-                        if item_url:
-                            title = e.get("title", f"Item {i}")
-                            download_items.append(
-                                DownloadItem(url=item_url, index=i, title=title)
-                            )
+                download_items = _items_from_entries(entries_list, limit)
                 self.total_items = len(download_items)
             else:
-                with yt_dlp.YoutubeDL(
-                    {
-                        "quiet": True,
-                        "no_warnings": True,
-                        "extract_flat": True,
-                        "noplaylist": not is_playlist,
-                        "socket_timeout": 30,
-                    }
-                ) as ydl:
+                # No preview to reuse: list the playlist with the same pooled
+                # flat-extraction instance previews use.
+                with self._ydl_pool.lease(build_flat_options(limit)) as ydl:
                     info = ydl.extract_info(url, download=False)
                     if info and "entries" in info:
-                        entries = [e for e in info["entries"] if e]
-                        if limit:
-                            entries = entries[:limit]
-                        for i, e in enumerate(entries, 1):
-                            item_url = e.get("webpage_url") or e.get("url", "")
-                            if item_url:
-                                title = e.get("title", f"Item {i}")
-                                download_items.append(
-                                    DownloadItem(url=item_url, index=i, title=title)
-                                )
+                        download_items = _items_from_entries(info["entries"], limit)
                         self.total_items = len(download_items)
                     else:
                         download_items = [
@@ -2860,38 +2907,43 @@ class ModernDownloader:
                         ]
                         self.total_items = 1
 
-            self.current_session.items = download_items
+            for item in download_items:
+                item.platform = detect_platform(item.url)
+                item.display_title = truncate(item.title, 30)
+            self.current_session.set_items(download_items)
             if not download_items:
                 raise RuntimeError("No downloadable items found")
 
             # Log settings
             if download_type == "video":
                 self.log(
-                    f"{platform} | Video | {resolution} | {video_format.upper()} | Concurrent: {concurrent} | Items: {self.total_items}",
+                    f"{platform} | Video | {resolution} | {video_format.upper()} | Concurrent: {concurrent_label} | Items: {self.total_items}",
                     "info",
                 )
             else:
                 self.log(
-                    f"{platform} | Audio | {fmt.upper()} | {quality} | Concurrent: {concurrent} | Items: {self.total_items}",
+                    f"{platform} | Audio | {fmt.upper()} | {quality} | Concurrent: {concurrent_label} | Items: {self.total_items}",
                     "info",
                 )
 
-            # Get ydl options
-            ydl_opts = self._get_ydl_opts(
-                download_type,
-                fmt,
-                quality,
-                resolution,
-                video_format,
-                subtitle,
-                subtitle_lang,
-                subtitle_embed,
-                sponsorblock,
-                thumbnail,
-                metadata,
-                False,
-                None,
-                url,
+            # Get ydl options, shared read-only by every item of the session
+            ydl_opts: Mapping[str, Any] = MappingProxyType(
+                self._get_ydl_opts(
+                    download_type,
+                    fmt,
+                    quality,
+                    resolution,
+                    video_format,
+                    subtitle,
+                    subtitle_lang,
+                    subtitle_embed,
+                    sponsorblock,
+                    thumbnail,
+                    metadata,
+                    False,
+                    None,
+                    url,
+                )
             )
 
             # Download items
@@ -2901,62 +2953,77 @@ class ModernDownloader:
                     if self._cancel_event.is_set() or not self.is_downloading:
                         break
                     self.log(
-                        f"Downloading [{item.index}/{len(download_items)}]: {truncate(item.title, 30)}",
+                        f"Downloading [{item.index}/{len(download_items)}]: {item.display_title}",
                         "download",
                     )
-                    self._download_single_item(item, ydl_opts, len(download_items))
+                    self._download_single_item(item, ydl_opts)
             else:
-                # Concurrent downloads with semaphore to limit concurrency
-                self.log(f"Starting {concurrent} concurrent downloads...", "info")
+                # Sliding window: keep at most `in_flight` items running, where
+                # that cap is fixed or, in Auto mode, follows throughput.
+                controller = (
+                    AdaptiveConcurrency(maximum=concurrent)
+                    if request.auto_concurrency
+                    else None
+                )
+                self._concurrency = controller
+                if controller is None:
+                    self.log(f"Starting {concurrent} concurrent downloads...", "info")
+                else:
+                    self.log("Starting downloads with automatic concurrency...", "info")
 
-                executor = ThreadPoolExecutor(max_workers=concurrent)
-                self._download_executor = executor
+                executor = self._get_download_executor(concurrent)
+                pending = deque(download_items)
+                active: Dict[Future, DownloadItem] = {}
                 try:
-                    future_to_item = {}
-                    for item in download_items:
+                    completed = 0
+                    while pending or active:
                         if self._cancel_event.is_set() or not self.is_downloading:
+                            self.log("Download cancelled", "warning")
                             break
-                        future = executor.submit(
-                            self._download_single_item,
-                            item,
-                            ydl_opts,
-                            len(download_items),
+                        in_flight = controller.target() if controller else concurrent
+                        while pending and len(active) < in_flight:
+                            item = pending.popleft()
+                            future = executor.submit(
+                                self._download_single_item,
+                                item,
+                                ydl_opts,
+                            )
+                            active[future] = item
+                        self._download_futures = list(active)
+
+                        # Auto mode wakes up each probe so long files cannot
+                        # hold the in-flight cap still.
+                        done, _ = wait(
+                            active,
+                            timeout=AUTO_CONCURRENCY_PROBE_SECONDS if controller else None,
+                            return_when=FIRST_COMPLETED,
                         )
-                        future_to_item[future] = item
-                        self._download_futures.append(future)
-
-                    # Wait for completion
-                    completed = 0
-                    for future in as_completed(future_to_item):
-                        item = future_to_item[future]
-                        try:
-                            success = future.result()
+                        for future in done:
+                            item = active.pop(future)
                             completed += 1
-                            if success:
-                                self.log(
-                                    f"✓ [{item.index}] {truncate(item.title, 30)} ({completed}/{len(download_items)})",
-                                    "success",
-                                )
-                            else:
+                            try:
+                                success = future.result()
+                                if success:
+                                    self.log(
+                                        f"✓ [{item.index}] {item.display_title} ({completed}/{len(download_items)})",
+                                        "success",
+                                    )
+                                else:
+                                    self.log(
+                                        f"✗ [{item.index}] Failed ({completed}/{len(download_items)})",
+                                        "error",
+                                    )
+                            except Exception as e:
                                 self.log(
-                                    f"✗ [{item.index}] Failed ({completed}/{len(download_items)})",
+                                    f"✗ [{item.index}] Error: {truncate(str(e), 40)} ({completed}/{len(download_items)})",
                                     "error",
                                 )
-                        except Exception as e:
-                            completed += 1
-                            self.log(
-                                f"✗ [{item.index}] Error: {truncate(str(e), 40)} ({completed}/{len(download_items)})",
-                                "error",
-                            )
-
-                        if self._cancel_event.is_set() or not self.is_downloading:
-                            self.log("Download cancelled", "warning")
-                            break
                 finally:
                     # This runs on the orchestration thread, not the Tk thread.
                     # Wait until active workers have observed cancellation before
                     # allowing a new session to clear the shared cancel event.
-                    executor.shutdown(wait=True)
+                    wait(active)
+                    self._concurrency = None
 
                 self._download_futures = []
 
@@ -2964,8 +3031,8 @@ class ModernDownloader:
                 return
 
             # Final status
-            self.downloaded_count = self._downloaded_items
-            self.failed_count = self._failed_items
+            self.downloaded_count = self.current_session.completed_count
+            self.failed_count = self.current_session.failed_count
             self.current_session.end_time = time.time()
 
             # Update progress bar with final status
@@ -2979,9 +3046,11 @@ class ModernDownloader:
                     "success",
                 )
                 self._call_ui(
-                    lambda: self._update_ui_complete_with_status(
-                        "Success", COLORS["success"]
-                    ),
+                    partial(
+                        self._update_ui_complete_with_status,
+                        "Success",
+                        COLORS["success"],
+                    )
                 )
             else:
                 self.log(
@@ -2989,27 +3058,44 @@ class ModernDownloader:
                     "warning",
                 )
                 self._call_ui(
-                    lambda: self._update_ui_complete_with_status(
-                        f"Done ({self.failed_count} failed)", COLORS["warning"]
-                    ),
+                    partial(
+                        self._update_ui_complete_with_status,
+                        f"Done ({self.failed_count} failed)",
+                        COLORS["warning"],
+                    )
                 )
 
         except Exception as e:
             self.log(f"Error: {truncate(str(e), 60)}", "error")
             self.failed_count += 1
             self._call_ui(
-                lambda: self._update_ui_complete_with_status(
-                    "Failed", COLORS["danger"]
-                ),
+                partial(
+                    self._update_ui_complete_with_status, "Failed", COLORS["danger"]
+                )
             )
 
         finally:
             was_cancelled = self._cancel_event.is_set()
             self.is_downloading = False
-            self._download_executor = None
             if was_cancelled and not self._is_closing:
                 self._call_ui(self._update_ui_finished)
 
+    def _get_download_executor(self, workers: int) -> ThreadPoolExecutor:
+        """Return the shared download executor, grown to at least workers"""
+        executor = self._download_executor
+        # A larger pool is reused as is: the sliding window in _download caps
+        # how many items are submitted, so spare threads just stay idle.
+        if executor is None or self._download_executor_workers < workers:
+            if executor is not None:
+                # Idle here: the previous session waited for all its futures.
+                executor.shutdown(wait=False)
+            executor = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="download"
+            )
+            self._download_executor = executor
+            self._download_executor_workers = workers
+        return executor
+
     def _update_ui_downloading(self):
         """Update UI for downloading state"""
         self.download_btn.configure(state="disabled", text="⬇ Downloading...")
@@ -3032,6 +3118,7 @@ class ModernDownloader:
 
     def _update_ui_complete_with_status(self, status_text: str, color: str):
         """Update UI with custom completion status"""
+        self._progress_shown = None
         self.progress_bar.set(1.0)
         self.progress_bar.configure(progress_color=color)
         self.progress_percent.configure(text="100%", text_color=color)
@@ -3057,9 +3144,9 @@ class ModernDownloader:
 
         # Reset counters and progress
         self.downloaded_count = 0
-        self._current_file_progress = 0.0
 
         # Reset progress bar to 0%
+        self._progress_shown = None
         self.progress_bar.set(0)
         self.progress_percent.configure(text="0%", text_color=COLORS["text_secondary"])
         self.progress_status.configure(
@@ -3118,6 +3205,7 @@ class ModernDownloader:
 
         self.download_btn.configure(state="disabled", text="⬇ Cancelling...")
         self.cancel_btn.configure(state="disabled")
+        self._progress_shown = None
         self.progress_bar.configure(progress_color=COLORS["warning"])
         self.progress_percent.configure(text="Cancelled", text_color=COLORS["warning"])
         self.progress_status.configure(
@@ -3125,7 +3213,6 @@ class ModernDownloader:
         )
         self.speed_label.configure(text="")
         self.eta_label.configure(text="")
-        self._current_file_progress = 0.0
 
         # The worker re-enables Start only after all active work has exited.
 
@@ -3149,6 +3236,8 @@ class ModernDownloader:
         if not self._validate_url(url):
             self.log("Invalid URL format", "error")
             return
+        if not self._ensure_download_dir():
+            return
         if not self._check_disk_space(500):
             self.log("Insufficient disk space (need 500MB+)", "error")
             return
@@ -3157,6 +3246,12 @@ class ModernDownloader:
             return
 
         concurrent_text = self.concurrent_var.get()
+        auto_concurrency = concurrent_text == "Auto"
+        if auto_concurrency:
+            concurrent = AUTO_CONCURRENCY_MAX
+        else:
+            concurrent = _digits_or(3)(concurrent_text)
+            concurrent = max(1, min(concurrent, MAX_CONCURRENT_DOWNLOADS))
         is_playlist = self.playlist_var.get()
         preview_matches = self.last_url == url
         request = DownloadRequest(
@@ -3174,9 +3269,10 @@ class ModernDownloader:
             metadata=self.metadata_var.get(),
             is_playlist=is_playlist,
             limit=self._get_limit() if is_playlist else None,
-            concurrent=int(concurrent_text) if concurrent_text.isdigit() else 3,
+            concurrent=concurrent,
             video_info=self.video_info if preview_matches else None,
             entries=list(self.entries_list) if preview_matches else [],
+            auto_concurrency=auto_concurrency,
         )
 
         self._last_download_time = time.time()
@@ -3186,33 +3282,35 @@ class ModernDownloader:
         thread = threading.Thread(target=self._download, args=(request,), daemon=True)
         thread.start()
 
-    def _check_ffmpeg_async(self):
-        """Check FFmpeg in background"""
-
-        def check():
-            try:
-                result = subprocess.run(
-                    ["ffmpeg", "-version"], capture_output=True, text=True, timeout=5
-                )
-                if result.returncode == 0:
-                    self.log("FFmpeg ready", "success")
-                    self._call_ui(
-                        lambda: self.header_status.configure(
-                            text=f"{ICONS['ready']} Ready", text_color=COLORS["success"]
-                        ),
-                    )
-                else:
-                    raise Exception("FFmpeg not found")
-            except Exception:
-                self.log("FFmpeg not found - Install: winget install ffmpeg", "warning")
-                self._call_ui(
-                    lambda: self.header_status.configure(
-                        text=f"{ICONS['warning']} FFmpeg needed",
-                        text_color=COLORS["warning"],
-                    ),
-                )
-
-        threading.Thread(target=check, daemon=True).start()
+    def _check_ffmpeg_worker(self):
+        """Probe FFmpeg in a background thread and report the result to the UI."""
+        try:
+            ok = (
+                subprocess.run(
+                    ["ffmpeg", "-version"],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    timeout=5,
+                ).returncode
+                == 0
+            )
+        except (OSError, subprocess.SubprocessError):
+            ok = False
+        self._call_ui(partial(self._apply_ffmpeg_state, ok))
+
+    def _apply_ffmpeg_state(self, ok: bool):
+        """Show the FFmpeg probe result in the header status pill."""
+        if ok:
+            self.log("FFmpeg ready", "success")
+            self.header_status.configure(
+                text=f"{ICONS['ready']} Ready", text_color=COLORS["success"]
+            )
+        else:
+            self.log("FFmpeg not found - Install: winget install ffmpeg", "warning")
+            self.header_status.configure(
+                text=f"{ICONS['warning']} FFmpeg needed",
+                text_color=COLORS["warning"],
+            )
 
     def run(self):
         """Start application"""
@@ -0,0 +1,72 @@
+"""Throughput-driven concurrency limit for the "Auto" download mode."""
+
+import threading
+import time
+from typing import Callable, Optional
+
+from .config import (
+    AUTO_CONCURRENCY_INITIAL,
+    AUTO_CONCURRENCY_MAX,
+    AUTO_CONCURRENCY_PROBE_SECONDS,
+)
+
+
+class AdaptiveConcurrency:
+    """Hill-climb the number of parallel downloads toward higher throughput.
+
+    Workers report received bytes with ``add_bytes``. Each probe interval,
+    ``target`` compares the aggregate throughput with the previous probe and
+    moves the limit one step: onward while throughput improves, back the other
+    way once it stops. Single steps avoid the large jumps that overload hosts
+    which throttle parallel connections.
+    """
+
+    def __init__(
+        self,
+        initial: int = AUTO_CONCURRENCY_INITIAL,
+        minimum: int = 1,
+        maximum: int = AUTO_CONCURRENCY_MAX,
+        probe_interval: float = AUTO_CONCURRENCY_PROBE_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._minimum = minimum
+        self._maximum = maximum
+        self._probe_interval = probe_interval
+        self._clock = clock
+        self._target = min(max(initial, minimum), maximum)
+        self._direction = 1
+        self._bytes = 0
+        self._probe_start = clock()
+        self._last_throughput: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def maximum(self) -> int:
+        return self._maximum
+
+    def add_bytes(self, count: int) -> None:
+        if count > 0:
+            with self._lock:
+                self._bytes += count
+
+    def target(self) -> int:
+        """Return the current limit, re-evaluating it once per probe interval."""
+        with self._lock:
+            now = self._clock()
+            elapsed = now - self._probe_start
+            if elapsed < self._probe_interval:
+                return self._target
+            throughput = self._bytes / elapsed
+            self._bytes = 0
+            self._probe_start = now
+
+            last = self._last_throughput
+            self._last_throughput = throughput
+            if last is not None and throughput <= last:
+                self._direction = -self._direction
+            step = self._target + self._direction
+            if not self._minimum <= step <= self._maximum:
+                self._direction = -self._direction
+                step = self._target + self._direction
+            self._target = min(max(step, self._minimum), self._maximum)
+            return self._target
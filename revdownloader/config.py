@@ -1,26 +1,31 @@
 """Application-wide configuration that is independent from the UI."""
 
-SUPPORTED_PLATFORMS = frozenset(
-    {
-        "youtube.com",
-        "youtu.be",
-        "facebook.com",
-        "fb.watch",
-        "instagram.com",
-        "tiktok.com",
-        "twitter.com",
-        "x.com",
-        "soundcloud.com",
-        "vimeo.com",
-        "dailymotion.com",
-        "bilibili.com",
-        "twitch.tv",
-        "reddit.com",
-        "pinterest.com",
-        "linkedin.com",
-        "bandcamp.com",
-    }
-)
+import os
+
+DEFAULT_DOWNLOAD_PATH = os.path.join(os.path.expanduser("~"), "Downloads", "REVMusic")
+
+# Supported hostname suffix -> name shown in the UI
+PLATFORM_NAMES = {
+    "youtube.com": "YouTube",
+    "youtu.be": "YouTube",
+    "facebook.com": "Facebook",
+    "fb.watch": "Facebook",
+    "instagram.com": "Instagram",
+    "tiktok.com": "TikTok",
+    "twitter.com": "Twitter",
+    "x.com": "X",
+    "soundcloud.com": "SoundCloud",
+    "vimeo.com": "Vimeo",
+    "dailymotion.com": "DailyMotion",
+    "bilibili.com": "Bilibili",
+    "twitch.tv": "Twitch",
+    "reddit.com": "Reddit",
+    "pinterest.com": "Pinterest",
+    "linkedin.com": "LinkedIn",
+    "bandcamp.com": "Bandcamp",
+}
+
+SUPPORTED_PLATFORMS = frozenset(PLATFORM_NAMES)
 
 DRM_PLATFORMS = frozenset(
     {
@@ -32,8 +37,37 @@ DRM_PLATFORMS = frozenset(
     }
 )
 
+# Seconds a free-disk-space probe is reused before querying the drive again
+DISK_CHECK_TTL = 10.0
+
 MAX_RETRIES = 3
+# After this many items in a row fail on 403, later 403s are not retried
+FORBIDDEN_STREAK_LIMIT = 2
 RETRY_DELAY_BASE = 2
 RETRY_MAX_DELAY = 30
 DOWNLOAD_TIMEOUT = 300
+# yt-dlp socket timeout for API and CLI runs alike
+SOCKET_TIMEOUT = 30
+
+# Pending log lines kept between UI drains; the oldest are dropped first.
+LOG_BUFFER_SIZE = 1000
+
+# Lines kept in the log widget; older lines are trimmed after each batch.
+LOG_WIDGET_MAX_LINES = 500
+
+# A download's progress hook reports after this many bytes or seconds,
+# whichever comes first; yt-dlp calls it for every chunk.
+PROGRESS_MIN_BYTES = 256 * 1024
+PROGRESS_MIN_INTERVAL = 0.1
+
+# Ceiling for any fixed concurrency, including values hand-edited into
+# settings.json; the menu offers up to this many.
+MAX_CONCURRENT_DOWNLOADS = 10
+
+# "Auto" concurrency: starting limit, ceiling and throughput probe length.
+# Every finished file goes through CPU-bound FFmpeg post-processing, so the
+# ceiling also follows the core count.
+AUTO_CONCURRENCY_INITIAL = 2
+AUTO_CONCURRENCY_MAX = max(AUTO_CONCURRENCY_INITIAL, min(8, os.cpu_count() or 2))
+AUTO_CONCURRENCY_PROBE_SECONDS = 3.0
 
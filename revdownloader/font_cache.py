@@ -0,0 +1,45 @@
+"""Disk cache for the system font family list probed at startup."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Iterable, Optional, Tuple
+
+# Newly installed fonts are picked up once the cache is older than this.
+FONT_CACHE_MAX_AGE = 7 * 24 * 60 * 60
+
+
+def default_font_cache_path() -> Path:
+    base = os.environ.get("LOCALAPPDATA") or os.environ.get("XDG_CACHE_HOME")
+    cache_root = Path(base) if base else Path.home() / ".cache"
+    return cache_root / "REVDownloader" / "font_families.json"
+
+
+def load_font_families(
+    path: Path, max_age: float = FONT_CACHE_MAX_AGE
+) -> Optional[Tuple[str, ...]]:
+    try:
+        if time.time() - path.stat().st_mtime > max_age:
+            return None
+        with path.open("r", encoding="utf-8") as cache_file:
+            data = json.load(cache_file)
+    except (OSError, ValueError):
+        return None
+    if not data or not isinstance(data, list):
+        return None
+    if not all(isinstance(family, str) for family in data):
+        return None
+    return tuple(data)
+
+
+def save_font_families(path: Path, families: Iterable[str]) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as cache_file:
+            json.dump(list(families), cache_file, ensure_ascii=False)
+    except OSError:
+        # The cache is only a startup shortcut; failing to write it is harmless.
+        pass
@@ -1,23 +1,31 @@
 """Small text and display-formatting helpers."""
 
 import re
+from functools import lru_cache
 from typing import Any
 
-_ANSI_PATTERN = re.compile(r"\x1b\[[0-9;]*m")
-_MOJIBAKE_CHARS = set("àáâãäåæçèéêëìíîïðñòóôõöøùúûüýþÿ")
+# CSI escape sequences (colors, cursor moves, line erases) and the bare
+# carriage returns yt-dlp emits when redrawing its progress line.
+_strip_control = re.compile(r"\x1b\[[0-9;?]*[A-Za-z]|\r").sub
+_MOJIBAKE_PATTERN = re.compile("[àáâãäåæçèéêëìíîïðñòóôõöøùúûüýþÿ]")
 
 
 def sanitize_text(text: Any) -> str:
     if not isinstance(text, str):
         text = str(text)
+    return _sanitize(text)
 
-    if "\x1b" in text:
-        text = _ANSI_PATTERN.sub("", text)
 
-    if text and (
-        text[0] in _MOJIBAKE_CHARS
-        or any(character in text for character in _MOJIBAKE_CHARS)
-    ):
+@lru_cache(maxsize=4096)
+def _sanitize(text: str) -> str:
+    if "\x1b" in text or "\r" in text:
+        text = _strip_control("", text)
+
+    # Mojibake needs non-ASCII characters, so plain ASCII titles skip the probe.
+    if text.isascii():
+        return text
+
+    if _MOJIBAKE_PATTERN.search(text):
         try:
             text = text.encode("latin-1").decode("utf-8")
         except (UnicodeEncodeError, UnicodeDecodeError):
@@ -27,17 +35,25 @@ def sanitize_text(text: Any) -> str:
 
 
 def truncate(text: str, length: int) -> str:
-    return text[:length] if len(text) > length else text
+    # Slicing past the end returns the original string without copying.
+    return text[:length]
+
+
+# (divisor, suffix, decimals) indexed by floor(log1024(bytes)).
+_BYTE_UNITS = (
+    (1, "B", 0),
+    (1024, "KB", 1),
+    (1024 ** 2, "MB", 1),
+    (1024 ** 3, "GB", 2),
+)
 
 
 def format_bytes(bytes_value: int) -> str:
     if bytes_value < 1024:
         return f"{bytes_value}B"
-    if bytes_value < 1024 * 1024:
-        return f"{bytes_value / 1024:.1f}KB"
-    if bytes_value < 1024 * 1024 * 1024:
-        return f"{bytes_value / (1024 * 1024):.1f}MB"
-    return f"{bytes_value / (1024 * 1024 * 1024):.2f}GB"
+    index = min((int(bytes_value).bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+    divisor, suffix, decimals = _BYTE_UNITS[index]
+    return f"{bytes_value / divisor:.{decimals}f}{suffix}"
 
 
 def format_speed(bytes_per_second: float) -> str:
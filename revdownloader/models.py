@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import sys
+import threading
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
+# Per-item dataclasses drop their __dict__ where the interpreter supports it;
+# large playlists create one DownloadItem per entry.
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class DownloadStatus(Enum):
     PENDING = "pending"
@@ -16,7 +22,7 @@ class DownloadStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DownloadItem:
     url: str
     index: int
@@ -28,6 +34,10 @@ class DownloadItem:
     start_time: Optional[float] = None
     end_time: Optional[float] = None
     file_path: Optional[str] = None
+    # Display name from detect_platform, resolved once when the batch is built
+    platform: Optional[str] = None
+    # Title shortened for log lines, also set when the batch is built
+    display_title: str = ""
 
     @property
     def duration(self) -> float:
@@ -36,8 +46,15 @@ class DownloadItem:
         return 0.0
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DownloadSession:
+    """Download batch with running status counts and progress total.
+
+    Counters are kept up to date by ``set_items``, ``set_status`` and
+    ``set_progress``; workers should change items through those methods so
+    the properties below stay O(1).
+    """
+
     session_id: str
     url: str
     items: List[DownloadItem] = field(default_factory=list)
@@ -46,20 +63,70 @@ class DownloadSession:
     total_bytes: int = 0
     downloaded_bytes: int = 0
     is_cancelled: bool = False
+    _status_counts: Dict[DownloadStatus, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _progress_total: float = field(default=0.0, init=False, repr=False, compare=False)
+    # Items in a row that failed on HTTP 403; any completed item resets it
+    forbidden_streak: int = field(default=0, init=False, compare=False)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self.set_items(self.items)
+
+    def set_items(self, items: List[DownloadItem]) -> None:
+        with self._lock:
+            self.items = items
+            counts: Dict[DownloadStatus, int] = {}
+            for item in items:
+                counts[item.status] = counts.get(item.status, 0) + 1
+            self._status_counts = counts
+            self._progress_total = sum(item.progress for item in items)
+
+    def set_status(self, item: DownloadItem, status: DownloadStatus) -> None:
+        with self._lock:
+            previous = item.status
+            if previous is status:
+                return
+            item.status = status
+            counts = self._status_counts
+            counts[previous] = counts.get(previous, 0) - 1
+            counts[status] = counts.get(status, 0) + 1
+
+    def set_progress(self, item: DownloadItem, progress: float) -> float:
+        """Record an item's progress and return the session's overall progress."""
+        progress = min(max(progress, 0.0), 1.0)
+        with self._lock:
+            self._progress_total += progress - item.progress
+            item.progress = progress
+            return self._overall_progress()
+
+    def record_forbidden(self) -> None:
+        with self._lock:
+            self.forbidden_streak += 1
+
+    def clear_forbidden(self) -> None:
+        with self._lock:
+            self.forbidden_streak = 0
 
     @property
     def completed_count(self) -> int:
-        return sum(1 for item in self.items if item.status == DownloadStatus.COMPLETED)
+        return self._status_counts.get(DownloadStatus.COMPLETED, 0)
 
     @property
     def failed_count(self) -> int:
-        return sum(1 for item in self.items if item.status == DownloadStatus.FAILED)
+        return self._status_counts.get(DownloadStatus.FAILED, 0)
 
     @property
     def progress(self) -> float:
+        return self._overall_progress()
+
+    def _overall_progress(self) -> float:
         if not self.items:
             return 0.0
-        return sum(item.progress for item in self.items) / len(self.items)
+        return min(max(self._progress_total / len(self.items), 0.0), 1.0)
 
 
 @dataclass(frozen=True)
@@ -83,3 +150,5 @@ class DownloadRequest:
     concurrent: int
     video_info: Optional[Dict[str, Any]]
     entries: List[Dict[str, Any]]
+    # "Auto" mode: concurrent is the ceiling, the live limit adapts to throughput
+    auto_concurrency: bool = False
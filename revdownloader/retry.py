@@ -0,0 +1,21 @@
+"""Retry backoff schedule shared by download and preview workers."""
+
+import random
+
+from .config import MAX_RETRIES, RETRY_DELAY_BASE, RETRY_MAX_DELAY
+
+# Capped exponential delay per attempt, computed once at import.
+RETRY_DELAYS = tuple(
+    min(RETRY_DELAY_BASE * (2**attempt), RETRY_MAX_DELAY)
+    for attempt in range(MAX_RETRIES)
+)
+
+
+def backoff_delay(attempt: int) -> float:
+    """Return a full-jitter delay in ``[0, RETRY_DELAYS[attempt]]`` seconds.
+
+    Randomising the whole interval keeps concurrent workers that failed
+    together (for example on a shared 403) from retrying in lockstep.
+    """
+    cap = RETRY_DELAYS[min(max(attempt, 0), len(RETRY_DELAYS) - 1)]
+    return random.uniform(0, cap)
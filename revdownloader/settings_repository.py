@@ -3,27 +3,51 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
 
 class JsonSettingsRepository:
     def __init__(self, path: Path) -> None:
         self.path = path
+        # (mtime_ns, size) of the file the cached dict was read from/written to
+        self._cache: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
+
+    def _signature(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
 
     def load(self) -> Dict[str, Any]:
-        if not self.path.exists():
+        signature = self._signature()
+        if signature is None:
+            self._cache = None
             return {}
+        if self._cache is not None and self._cache[0] == signature:
+            return dict(self._cache[1])
         with self.path.open("r", encoding="utf-8") as settings_file:
             data = json.load(settings_file)
         if not isinstance(data, dict):
             raise ValueError("Settings root must be a JSON object")
-        return data
+        self._cache = (signature, data)
+        return dict(data)
 
     def save(self, settings: Dict[str, Any]) -> None:
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        with self.path.open("w", encoding="utf-8") as settings_file:
+        # Write a sibling file and swap it in, so a crash mid-write never
+        # leaves a truncated settings.json behind. The fsync makes the new
+        # contents durable before the rename can be.
+        temp_path = self.path.with_name(f"{self.path.name}.tmp")
+        with temp_path.open("w", encoding="utf-8") as settings_file:
             json.dump(settings, settings_file, indent=2, ensure_ascii=False)
+            settings_file.flush()
+            os.fsync(settings_file.fileno())
+        os.replace(temp_path, self.path)
+        signature = self._signature()
+        self._cache = (signature, dict(settings)) if signature else None
 
     def update(self, values: Dict[str, Any]) -> None:
         try:
@@ -1,6 +1,11 @@
-"""Visual design tokens and icon sets used by the desktop UI."""
+"""Visual design tokens and icon sets used by the desktop UI.
 
-COLORS = {
+The tables are read-only views; widgets share them, so nothing may edit them.
+"""
+
+from types import MappingProxyType
+
+COLORS = MappingProxyType({
     "bg_primary": "#08080d",
     "bg_secondary": "#101019",
     "bg_card": "#171723",
@@ -32,27 +37,27 @@ COLORS = {
     "gradient_start": "#00d9a5",
     "gradient_end": "#00b4d8",
     "track_strip": "#00d9a5",
-}
+})
 
-RADIUS = {
+RADIUS = MappingProxyType({
     "sm": 8,
     "md": 12,
     "lg": 16,
     "xl": 20,
     "pill": 24,
     "bar": 6,
-}
+})
 
-PAD = {
+PAD = MappingProxyType({
     "xs": 4,
     "sm": 8,
     "md": 12,
     "lg": 16,
     "xl": 20,
     "xxl": 24,
-}
+})
 
-ICONS_STD = {
+ICONS_STD = MappingProxyType({
     "logo": "◉",
     "music": "♪",
     "url": "∘",
@@ -73,9 +78,9 @@ ICONS_STD = {
     "playlist": "☰",
     "retry": "↻",
     "pause": "⏸",
-}
+})
 
-ICONS_NERD = {
+ICONS_NERD = MappingProxyType({
     "logo": "\uf001",
     "music": "\uf001",
     "url": "\uf0c1",
@@ -96,4 +101,4 @@ ICONS_NERD = {
     "playlist": "\uf03a",
     "retry": "\uf01e",
     "pause": "\uf04c",
-}
+})
@@ -1,13 +1,20 @@
 """URL validation and platform classification."""
 
-from typing import Optional
+import re
+from enum import Enum
+from functools import lru_cache
+from typing import Dict, NamedTuple, Optional, Tuple
 from urllib.parse import urlsplit
 
-from .config import DRM_PLATFORMS, SUPPORTED_PLATFORMS
+from .config import DRM_PLATFORMS, PLATFORM_NAMES, SUPPORTED_PLATFORMS
 
+# Same set as str.isspace, but scanned in C instead of a generator
+_has_whitespace = re.compile(r"\s").search
 
+
+@lru_cache(maxsize=4096)
 def _hostname(url: str) -> Optional[str]:
-    if not url or any(character.isspace() for character in url):
+    if not url or _has_whitespace(url):
         return None
     try:
         parsed = urlsplit(url)
@@ -29,27 +36,90 @@ def _hostname(url: str) -> Optional[str]:
     return hostname
 
 
-def _matches_domain(hostname: str, domain: str) -> bool:
-    return hostname == domain or hostname.endswith(f".{domain}")
+class PlatformKind(Enum):
+    SUPPORTED = "supported"
+    DRM = "drm"
 
 
-def detect_platform(url: str) -> Optional[str]:
+# One table for both lists, so a hostname is classified in a single pass.
+_PLATFORM_KINDS: Dict[str, PlatformKind] = {
+    **dict.fromkeys(SUPPORTED_PLATFORMS, PlatformKind.SUPPORTED),
+    **dict.fromkeys(DRM_PLATFORMS, PlatformKind.DRM),
+}
+
+
+def _classify_hostname(hostname: str) -> Optional[Tuple[str, PlatformKind]]:
+    # Walk the hostname's dot-suffixes from longest to shortest, so matching
+    # costs one dict lookup per label rather than a scan over every domain.
+    suffix = hostname
+    while True:
+        kind = _PLATFORM_KINDS.get(suffix)
+        if kind is not None:
+            return suffix, kind
+        _, separator, suffix = suffix.partition(".")
+        if not separator:
+            return None
+
+
+# Shared by detect_platform/is_drm_platform, which run on every paste,
+# preview and download of the same URL.
+@lru_cache(maxsize=512)
+def _classify(url: str) -> Optional[Tuple[str, PlatformKind]]:
     hostname = _hostname(url)
-    if hostname is None:
+    return _classify_hostname(hostname) if hostname else None
+
+
+def platform_kind(url: str) -> Optional[PlatformKind]:
+    match = _classify(url)
+    return match[1] if match else None
+
+
+def detect_platform(url: str) -> Optional[str]:
+    match = _classify(url)
+    if match is None or match[1] is not PlatformKind.SUPPORTED:
         return None
-    for platform in SUPPORTED_PLATFORMS:
-        if _matches_domain(hostname, platform):
-            return platform.split(".")[0].title()
-    return None
+    return PLATFORM_NAMES[match[0]]
 
 
 def is_drm_platform(url: str) -> bool:
-    hostname = _hostname(url)
-    return bool(
-        hostname
-        and any(_matches_domain(hostname, platform) for platform in DRM_PLATFORMS)
-    )
+    match = _classify(url)
+    return match is not None and match[1] is PlatformKind.DRM
 
 
 def is_valid_url(url: str) -> bool:
     return _hostname(url) is not None
+
+
+# YouTube playlists, YouTube Music lists, SoundCloud sets, Bandcamp albums;
+# one pass over the URL instead of a substring scan per pattern.
+_PLAYLIST_PATTERN = re.compile(
+    r"playlist\?list=|/playlist/"
+    r"|music\.youtube\.com.*list="
+    r"|soundcloud\.com.*/sets/"
+    r"|bandcamp\.com.*/album/",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+# Bounded like the other URL caches: a long session of pastes cannot grow it.
+@lru_cache(maxsize=512)
+def is_playlist_url(url: str) -> bool:
+    return _PLAYLIST_PATTERN.search(url) is not None
+
+
+class UrlInfo(NamedTuple):
+    valid: bool
+    platform: Optional[str]
+    is_drm: bool
+    is_playlist: bool
+
+
+@lru_cache(maxsize=512)
+def classify_url(url: str) -> UrlInfo:
+    """Everything the UI asks about a URL, answered in one cached call."""
+    return UrlInfo(
+        valid=is_valid_url(url),
+        platform=detect_platform(url),
+        is_drm=is_drm_platform(url),
+        is_playlist=is_playlist_url(url),
+    )
@@ -0,0 +1,92 @@
+"""Reusable yt-dlp ``YoutubeDL`` instances keyed by their options."""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Mapping
+
+
+class YoutubeDLPool:
+    """Lend out idle ``YoutubeDL`` instances built from identical options.
+
+    Building a ``YoutubeDL`` loads extractor classes, cookies and
+    post-processors, so workers lease an idle instance for the same options
+    instead of constructing one per item. A leased instance is used by one
+    thread at a time and goes back to the pool when the lease ends.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[Dict[str, Any]], Any],
+        max_idle_per_key: int = 4,
+        max_keys: int = 4,
+    ) -> None:
+        self._factory = factory
+        self._max_idle_per_key = max_idle_per_key
+        self._max_keys = max_keys
+        self._idle: "OrderedDict[str, List[Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @staticmethod
+    def _key(options: Mapping[str, Any]) -> str:
+        # Hooks are keyed by repr, so callers should pass stable callables.
+        return json.dumps(dict(options), sort_keys=True, default=repr)
+
+    @contextmanager
+    def lease(self, options: Mapping[str, Any]) -> Iterator[Any]:
+        key = self._key(options)
+        with self._lock:
+            idle = self._idle.get(key)
+            ydl = idle.pop() if idle else None
+        if ydl is None:
+            ydl = self._factory(dict(options))
+        else:
+            # YoutubeDL keeps the error code of earlier downloads and returns
+            # it from every later download() call; start each lease clean.
+            if hasattr(ydl, "_download_retcode"):
+                ydl._download_retcode = 0
+        try:
+            yield ydl
+        finally:
+            self._release(key, ydl)
+
+    def _release(self, key: str, ydl: Any) -> None:
+        evicted: List[Any] = []
+        with self._lock:
+            if self._closed:
+                evicted.append(ydl)
+            else:
+                idle = self._idle.setdefault(key, [])
+                self._idle.move_to_end(key)
+                if len(idle) < self._max_idle_per_key:
+                    idle.append(ydl)
+                else:
+                    evicted.append(ydl)
+                while len(self._idle) > self._max_keys:
+                    _, stale = self._idle.popitem(last=False)
+                    evicted.extend(stale)
+        for instance in evicted:
+            self._close_instance(instance)
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            instances = [ydl for idle in self._idle.values() for ydl in idle]
+            self._idle.clear()
+        for ydl in instances:
+            self._close_instance(ydl)
+
+    @staticmethod
+    def _close_instance(ydl: Any) -> None:
+        try:
+            close = getattr(ydl, "close", None)
+            if close is not None:
+                close()
+            else:
+                ydl.__exit__(None, None, None)
+        except Exception:
+            pass
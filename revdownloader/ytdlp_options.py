@@ -1,7 +1,75 @@
 """Build yt-dlp options without depending on the GUI."""
 
-from pathlib import Path
-from typing import Any, Callable, Dict, Optional
+import os
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional
+
+from .config import SOCKET_TIMEOUT
+from .url_service import detect_platform
+
+
+# Resolution menu label -> yt-dlp height filter ("" means no limit)
+_RESOLUTION_FILTERS: Mapping[str, str] = MappingProxyType(
+    {
+        "144p": "[height<=144]",
+        "240p": "[height<=240]",
+        "360p": "[height<=360]",
+        "480p": "[height<=480]",
+        "720p": "[height<=720]",
+        "1080p": "[height<=1080]",
+        "1440p": "[height<=1440]",
+        "2160p (4K)": "[height<=2160]",
+        "4320p (8K)": "[height<=4320]",
+        "Best": "",
+    }
+)
+
+# Audio format menu value -> FFmpegExtractAudio preferredcodec
+_AUDIO_CODECS: Mapping[str, str] = MappingProxyType(
+    {
+        "mp3": "mp3",
+        "m4a": "m4a",
+        "aac": "aac",
+        "wav": "wav",
+        "flac": "flac",
+        "ogg": "vorbis",
+        "opus": "opus",
+        "wma": "wmav2",
+        "aiff": "aiff",
+        "webm": "opus",
+    }
+)
+
+
+# Output template components below the download folder
+_PLAYLIST_TEMPLATE = ("%(playlist_title)s", "%(title)s.%(ext)s")
+_SINGLE_TEMPLATE = ("%(title)s.%(ext)s",)
+
+
+@lru_cache(maxsize=8)
+def build_flat_options(playlistend: Optional[int]) -> Mapping[str, Any]:
+    """Read-only flat-extraction options, shared per playlist end."""
+    options: Dict[str, Any] = {
+        "quiet": True,
+        "no_warnings": True,
+        # List playlist entries without resolving them, but still resolve a
+        # top-level redirect (short links) to the video it points at.
+        "extract_flat": "in_playlist",
+        "socket_timeout": SOCKET_TIMEOUT,
+        "retries": 3,
+        "file_access_retries": 3,
+        # Fragment retries for HLS/DASH
+        "fragment_retries": 3,
+    }
+    if playlistend:
+        options["playlistend"] = playlistend
+    return MappingProxyType(options)
+
+
+def build_preview_options(limit: Optional[int]) -> Mapping[str, Any]:
+    """Flat-extraction options for previews, which list at most 500 entries."""
+    return build_flat_options(limit or 500)
 
 
 def build_ydl_options(
@@ -23,13 +91,8 @@ def build_ydl_options(
     limit: Optional[int],
     source_url: str,
 ) -> Dict[str, Any]:
-    template = str(
-        Path(download_path)
-        / (
-            "%(playlist_title)s/%(title)s.%(ext)s"
-            if is_playlist
-            else "%(title)s.%(ext)s"
-        )
+    template = os.path.join(
+        download_path, *(_PLAYLIST_TEMPLATE if is_playlist else _SINGLE_TEMPLATE)
     )
 
     options: Dict[str, Any] = {
@@ -41,7 +104,7 @@ def build_ydl_options(
         "continuedl": True,
         "overwrites": True,
         "noplaylist": not is_playlist,
-        "socket_timeout": 30,
+        "socket_timeout": SOCKET_TIMEOUT,
         "retries": 10,
         "file_access_retries": 10,
         "fragment_retries": 10,
@@ -56,23 +119,11 @@ def build_ydl_options(
         "concurrent_fragment_downloads": 4,
     }
 
-    if "tiktok.com" in source_url.lower():
+    if detect_platform(source_url) == "TikTok":
         options["impersonate"] = "chrome"
 
     if download_type == "video":
-        resolution_filters = {
-            "144p": "[height<=144]",
-            "240p": "[height<=240]",
-            "360p": "[height<=360]",
-            "480p": "[height<=480]",
-            "720p": "[height<=720]",
-            "1080p": "[height<=1080]",
-            "1440p": "[height<=1440]",
-            "2160p (4K)": "[height<=2160]",
-            "4320p (8K)": "[height<=4320]",
-            "Best": "",
-        }
-        height_filter = resolution_filters.get(resolution, "[height<=1080]")
+        height_filter = _RESOLUTION_FILTERS.get(resolution, "[height<=1080]")
         options["format"] = (
             f"bestvideo{height_filter}+bestaudio/best{height_filter}"
             if height_filter
@@ -106,19 +157,7 @@ def build_ydl_options(
             options["addmetadata"] = True
             options.setdefault("postprocessors", []).append({"key": "FFmpegMetadata"})
     else:
-        codec_map = {
-            "mp3": "mp3",
-            "m4a": "m4a",
-            "aac": "aac",
-            "wav": "wav",
-            "flac": "flac",
-            "ogg": "vorbis",
-            "opus": "opus",
-            "wma": "wmav2",
-            "aiff": "aiff",
-            "webm": "opus",
-        }
-        codec = codec_map.get(audio_format, audio_format)
+        codec = _AUDIO_CODECS.get(audio_format, audio_format)
         postprocessor: Dict[str, Any] = {
             "key": "FFmpegExtractAudio",
             "preferredcodec": codec,
@@ -155,7 +194,7 @@ def build_ydl_options(
     return options
 
 
-def build_tiktok_cli_options(options: Dict[str, Any]) -> list:
+def build_tiktok_cli_options(options: Mapping[str, Any]) -> list:
     """Translate the supported yt-dlp API options to CLI arguments."""
     arguments = [
         "--impersonate",
@@ -169,7 +208,7 @@ def build_tiktok_cli_options(options: Dict[str, Any]) -> list:
         "--fragment-retries",
         "10",
         "--socket-timeout",
-        "30",
+        str(SOCKET_TIMEOUT),
         "--continue",
         "--force-overwrites",
         "-o",
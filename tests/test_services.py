@@ -1,5 +1,6 @@
 import tempfile
 import unittest
+from contextlib import ExitStack
 from pathlib import Path
 import sys
 
@@ -8,10 +9,25 @@ PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from revdownloader.models import DownloadItem, DownloadSession
+from revdownloader.concurrency import AdaptiveConcurrency
+from revdownloader.font_cache import load_font_families, save_font_families
+from revdownloader.models import DownloadItem, DownloadSession, DownloadStatus
+from revdownloader.retry import RETRY_DELAYS, backoff_delay
 from revdownloader.settings_repository import JsonSettingsRepository
-from revdownloader.url_service import detect_platform, is_drm_platform, is_valid_url
+from revdownloader.url_service import (
+    PlatformKind,
+    UrlInfo,
+    classify_url,
+    detect_platform,
+    is_drm_platform,
+    is_playlist_url,
+    is_valid_url,
+    platform_kind,
+)
+from revdownloader.ydl_pool import YoutubeDLPool
 from revdownloader.ytdlp_options import (
+    build_flat_options,
+    build_preview_options,
     build_tiktok_cli_options,
     build_ydl_options,
 )
@@ -20,8 +36,10 @@ from revdownloader.ytdlp_options import (
 class UrlServiceTests(unittest.TestCase):
     def test_detects_supported_platform(self) -> None:
         self.assertEqual(
-            detect_platform("https://www.youtube.com/watch?v=abc"), "Youtube"
+            detect_platform("https://www.youtube.com/watch?v=abc"), "YouTube"
         )
+        self.assertEqual(detect_platform("https://youtu.be/abc"), "YouTube")
+        self.assertEqual(detect_platform("https://vt.tiktok.com/abc"), "TikTok")
 
     def test_detects_drm_platform(self) -> None:
         self.assertTrue(is_drm_platform("https://open.spotify.com/track/abc"))
@@ -32,7 +50,7 @@ class UrlServiceTests(unittest.TestCase):
     def test_platform_detection_uses_hostname_boundary(self) -> None:
         self.assertIsNone(detect_platform("https://youtube.com.evil.test/video"))
         self.assertEqual(
-            detect_platform("https://music.youtube.com/watch?v=abc"), "Youtube"
+            detect_platform("https://music.youtube.com/watch?v=abc"), "YouTube"
         )
 
     def test_drm_detection_ignores_query_string(self) -> None:
@@ -40,9 +58,45 @@ class UrlServiceTests(unittest.TestCase):
             is_drm_platform("https://example.com/?next=spotify.com")
         )
 
+    def test_drm_detection_matches_subdomain_suffix(self) -> None:
+        self.assertTrue(is_drm_platform("https://music.apple.com/album/abc"))
+        self.assertFalse(is_drm_platform("https://www.apple.com/music"))
+
+    def test_platform_kind_classifies_in_one_lookup(self) -> None:
+        self.assertIs(
+            platform_kind("https://vt.tiktok.com/abc"), PlatformKind.SUPPORTED
+        )
+        self.assertIs(platform_kind("https://tidal.com/track/1"), PlatformKind.DRM)
+        self.assertIsNone(platform_kind("https://example.com/"))
+
     def test_rejects_invalid_hostname(self) -> None:
         self.assertFalse(is_valid_url("https://-invalid-host-/video"))
 
+    def test_detects_playlist_urls(self) -> None:
+        self.assertTrue(is_playlist_url("https://www.youtube.com/playlist?list=PL1"))
+        self.assertTrue(
+            is_playlist_url("https://MUSIC.youtube.com/watch?v=a&list=RD1")
+        )
+        self.assertTrue(is_playlist_url("https://soundcloud.com/artist/sets/mix"))
+        self.assertTrue(is_playlist_url("https://artist.bandcamp.com/album/lp"))
+        self.assertFalse(is_playlist_url("https://www.youtube.com/watch?v=abc"))
+        self.assertFalse(is_playlist_url("https://soundcloud.com/artist/track"))
+
+    def test_classify_url_answers_all_questions_at_once(self) -> None:
+        self.assertEqual(
+            classify_url("https://soundcloud.com/artist/sets/mix"),
+            UrlInfo(valid=True, platform="SoundCloud", is_drm=False, is_playlist=True),
+        )
+        self.assertEqual(
+            classify_url("https://open.spotify.com/track/abc"),
+            UrlInfo(valid=True, platform=None, is_drm=True, is_playlist=False),
+        )
+        self.assertFalse(classify_url("not a URL").valid)
+
+    def test_rejects_url_containing_whitespace(self) -> None:
+        self.assertFalse(is_valid_url("https://example.com/a b"))
+        self.assertFalse(is_valid_url("https://example.com/\u3000video"))
+
 
 class SettingsRepositoryTests(unittest.TestCase):
     def test_update_preserves_existing_values(self) -> None:
@@ -56,6 +110,19 @@ class SettingsRepositoryTests(unittest.TestCase):
                 {"download_type": "audio", "settings_collapsed": True},
             )
 
+    def test_load_reuses_cache_until_file_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            settings_path = Path(directory) / "settings.json"
+            repository = JsonSettingsRepository(settings_path)
+            repository.save({"download_type": "audio"})
+
+            loaded = repository.load()
+            loaded["download_type"] = "mutated"
+            self.assertEqual(repository.load(), {"download_type": "audio"})
+
+            settings_path.write_text('{"download_type": "video", "x": 1}', encoding="utf-8")
+            self.assertEqual(repository.load(), {"download_type": "video", "x": 1})
+
     def test_update_recovers_corrupt_json(self) -> None:
         with tempfile.TemporaryDirectory() as directory:
             settings_path = Path(directory) / "settings.json"
@@ -67,6 +134,26 @@ class SettingsRepositoryTests(unittest.TestCase):
             self.assertEqual(repository.load(), {"download_type": "video"})
 
 
+class FontCacheTests(unittest.TestCase):
+    def test_round_trips_and_expires_font_families(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            cache_path = Path(directory) / "cache" / "fonts.json"
+            save_font_families(cache_path, ("Segoe UI", "FiraCode Nerd Font"))
+
+            self.assertEqual(
+                load_font_families(cache_path),
+                ("Segoe UI", "FiraCode Nerd Font"),
+            )
+            self.assertIsNone(load_font_families(cache_path, max_age=-1))
+
+    def test_ignores_missing_or_malformed_cache(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            cache_path = Path(directory) / "fonts.json"
+            self.assertIsNone(load_font_families(cache_path))
+            cache_path.write_text('{"not": "a list"}', encoding="utf-8")
+            self.assertIsNone(load_font_families(cache_path))
+
+
 class DownloadSessionTests(unittest.TestCase):
     def test_progress_averages_all_active_items(self) -> None:
         first = DownloadItem(url="https://example.com/1", index=1, progress=0.25)
@@ -75,6 +162,112 @@ class DownloadSessionTests(unittest.TestCase):
 
         self.assertEqual(session.progress, 0.5)
 
+    def test_counters_follow_status_and_progress_updates(self) -> None:
+        first = DownloadItem(url="https://example.com/1", index=1)
+        second = DownloadItem(url="https://example.com/2", index=2)
+        session = DownloadSession(session_id="test", url="")
+        session.set_items([first, second])
+
+        session.set_status(first, DownloadStatus.COMPLETED)
+        session.set_status(second, DownloadStatus.FAILED)
+        session.set_status(second, DownloadStatus.FAILED)
+
+        self.assertEqual(session.completed_count, 1)
+        self.assertEqual(session.failed_count, 1)
+        self.assertEqual(session.set_progress(first, 1.5), 0.5)
+        self.assertEqual(first.progress, 1.0)
+
+    def test_forbidden_streak_resets_on_clear(self) -> None:
+        session = DownloadSession(session_id="test", url="")
+        session.record_forbidden()
+        session.record_forbidden()
+        self.assertEqual(session.forbidden_streak, 2)
+        session.clear_forbidden()
+        self.assertEqual(session.forbidden_streak, 0)
+
+
+class RetryBackoffTests(unittest.TestCase):
+    def test_delay_is_jittered_within_capped_schedule(self) -> None:
+        for attempt, cap in enumerate(RETRY_DELAYS):
+            for _ in range(20):
+                self.assertTrue(0 <= backoff_delay(attempt) <= cap)
+        self.assertLessEqual(backoff_delay(99), RETRY_DELAYS[-1])
+
+
+class AdaptiveConcurrencyTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.now = 0.0
+        self.controller = AdaptiveConcurrency(
+            initial=2, maximum=4, probe_interval=3.0, clock=lambda: self.now
+        )
+
+    def probe(self, received: int) -> int:
+        self.controller.add_bytes(received)
+        self.now += 3.0
+        return self.controller.target()
+
+    def test_holds_limit_within_probe_interval(self) -> None:
+        self.controller.add_bytes(1000)
+        self.now += 1.0
+        self.assertEqual(self.controller.target(), 2)
+
+    def test_climbs_while_throughput_improves_then_backs_off(self) -> None:
+        self.assertEqual(self.probe(100), 3)
+        self.assertEqual(self.probe(200), 4)
+        self.assertEqual(self.probe(150), 3)
+        self.assertEqual(self.probe(100), 4)
+
+    def test_stays_within_bounds(self) -> None:
+        self.assertEqual(self.probe(100), 3)
+        self.assertEqual(self.probe(200), 4)
+        self.assertEqual(self.probe(300), 3)
+        for _ in range(5):
+            self.assertTrue(1 <= self.probe(0) <= 4)
+
+
+class _FakeYoutubeDL:
+    def __init__(self, options) -> None:
+        self.options = options
+        self.closed = False
+        self._download_retcode = 0
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class YoutubeDLPoolTests(unittest.TestCase):
+    def test_reuses_instance_for_identical_options(self) -> None:
+        pool = YoutubeDLPool(_FakeYoutubeDL)
+        with pool.lease({"format": "best"}) as first:
+            first._download_retcode = 1
+        with pool.lease({"format": "best"}) as second:
+            self.assertIs(second, first)
+            self.assertEqual(second._download_retcode, 0)
+        with pool.lease({"format": "bestaudio"}) as other:
+            self.assertIsNot(other, first)
+
+        pool.close()
+        self.assertTrue(first.closed)
+        self.assertTrue(other.closed)
+
+    def test_keeps_one_idle_instance_per_concurrent_worker(self) -> None:
+        workers = 6
+        pool = YoutubeDLPool(_FakeYoutubeDL, max_idle_per_key=workers)
+        with ExitStack() as stack:
+            first = [
+                stack.enter_context(pool.lease({"format": "best"}))
+                for _ in range(workers)
+            ]
+        with ExitStack() as stack:
+            second = [
+                stack.enter_context(pool.lease({"format": "best"}))
+                for _ in range(workers)
+            ]
+
+        self.assertEqual({id(ydl) for ydl in second}, {id(ydl) for ydl in first})
+        self.assertFalse(any(ydl.closed for ydl in first))
+        pool.close()
+
 
 class YtDlpOptionsTests(unittest.TestCase):
     def test_builds_lossless_audio_options(self) -> None:
@@ -129,6 +322,38 @@ class YtDlpOptionsTests(unittest.TestCase):
         )
         self.assertEqual(options["subtitleslangs"], ["en"])
         self.assertEqual(options["playlistend"], 10)
+        self.assertEqual(
+            options["outtmpl"],
+            str(Path("downloads") / "%(playlist_title)s" / "%(title)s.%(ext)s"),
+        )
+
+    def test_impersonates_only_for_tiktok_hosts(self) -> None:
+        def options_for(url: str):
+            return build_ydl_options(
+                download_path="downloads",
+                progress_hook=lambda _: None,
+                download_type="audio",
+                audio_format="mp3",
+                quality="320",
+                resolution="1080p",
+                video_format="mp4",
+                subtitle=False,
+                subtitle_lang="en",
+                subtitle_embed=False,
+                sponsorblock=False,
+                thumbnail=False,
+                metadata=False,
+                is_playlist=False,
+                limit=None,
+                source_url=url,
+            )
+
+        self.assertEqual(
+            options_for("https://vt.tiktok.com/abc")["impersonate"], "chrome"
+        )
+        self.assertNotIn(
+            "impersonate", options_for("https://example.com/?ref=tiktok.com")
+        )
 
     def test_tiktok_cli_preserves_selected_features(self) -> None:
         arguments = build_tiktok_cli_options(
@@ -161,6 +386,10 @@ class FormattingTests(unittest.TestCase):
         self.assertEqual(format_bytes(500), "500B")
         self.assertEqual(format_bytes(2048), "2.0KB")
         self.assertEqual(format_bytes(10485760), "10.0MB")
+        self.assertEqual(format_bytes(1023), "1023B")
+        self.assertEqual(format_bytes(1024 ** 2 - 1), "1024.0KB")
+        self.assertEqual(format_bytes(3 * 1024 ** 3), "3.00GB")
+        self.assertEqual(format_bytes(5 * 1024 ** 4), "5120.00GB")
 
     def test_format_eta(self) -> None:
         from revdownloader.formatting import format_eta
@@ -168,11 +397,45 @@ class FormattingTests(unittest.TestCase):
         self.assertEqual(format_eta(125), "2m 5s")
         self.assertEqual(format_eta(3665), "1h 1m")
 
+    def test_sanitize_text(self) -> None:
+        from revdownloader.formatting import sanitize_text
+        self.assertEqual(sanitize_text("\x1b[0;32mSong\x1b[0m"), "Song")
+        self.assertEqual(sanitize_text("\x1b[K 42.0%\r"), " 42.0%")
+        self.assertEqual(
+            sanitize_text("เพลง".encode("utf-8").decode("latin-1")), "เพลง"
+        )
+        self.assertEqual(sanitize_text(42), "42")
+
+    def test_truncate(self) -> None:
+        from revdownloader.formatting import truncate
+        title = "Short title"
+        self.assertIs(truncate(title, 30), title)
+        self.assertEqual(truncate(title, 5), "Short")
+
     def test_format_speed(self) -> None:
         from revdownloader.formatting import format_speed
         self.assertEqual(format_speed(1048576), "1.0MB/s")
 
 
+class PreviewOptionsTests(unittest.TestCase):
+    def test_options_are_shared_and_read_only(self) -> None:
+        options = build_preview_options(25)
+        self.assertIs(build_preview_options(25), options)
+        self.assertEqual(options["playlistend"], 25)
+        self.assertEqual(build_preview_options(None)["playlistend"], 500)
+        self.assertIs(build_preview_options(500), build_flat_options(500))
+        self.assertNotIn("playlistend", build_flat_options(None))
+        with self.assertRaises(TypeError):
+            options["playlistend"] = 1  # type: ignore[index]
+
+    def test_pool_accepts_read_only_options(self) -> None:
+        pool = YoutubeDLPool(_FakeYoutubeDL)
+        with pool.lease(build_preview_options(10)) as first:
+            self.assertEqual(first.options["playlistend"], 10)
+        with pool.lease(build_preview_options(10)) as second:
+            self.assertIs(second, first)
+
+
 class PerformanceOptionsTests(unittest.TestCase):
     def test_speed_optimizations_enabled(self) -> None:
         options = build_ydl_options(
@@ -4,10 +4,12 @@ Create a simple icon for REV Music Downloader
 Requires: pip install pillow
 
 Usage: python tools/icons/create_icon.py [style]
-  style: 1 = Music note (default), 2 = Letter R, 3 = Download arrow
+  style: 1 = Music note (default), 2 = Letter R, 3 = Download arrow,
+         all = every style, saved as icon_music/icon_r/icon_arrow
 """
 
 from PIL import Image, ImageDraw, ImageFont
+from functools import lru_cache
 from pathlib import Path
 import sys
 
@@ -15,139 +17,142 @@ import sys
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 ICON_DIR = PROJECT_ROOT / "assets" / "icons"
 ICON_DIR.mkdir(parents=True, exist_ok=True)
-ICON_ICO = ICON_DIR / "icon.ico"
-ICON_PNG = ICON_DIR / "icon.png"
+ICON_STEM = "icon"
 
-def create_music_icon():
-    """Create music note icon drawn as shapes"""
-    
-    sizes = [256, 128, 64, 48, 32, 16]
-    images = []
+# Each icon is drawn once at the largest size; smaller sizes are resampled
+# from that master instead of being redrawn.
+SIZES = [256, 128, 64, 48, 32, 16]
+MASTER_SIZE = SIZES[0]
+
+
+def _downsample(master):
+    """Return the master followed by LANCZOS-resampled copies for SIZES[1:]"""
+    return [master] + [master.resize((s, s), Image.LANCZOS) for s in SIZES[1:]]
+
+
+@lru_cache(maxsize=32)
+def _get_font(px):
+    """Load Arial Bold at px, falling back to Arial, then PIL's default font"""
+    for family in ("arialbd.ttf", "arial.ttf"):
+        try:
+            return ImageFont.truetype(family, px)
+        except OSError:
+            pass
+    return ImageFont.load_default()
+
+
+@lru_cache(maxsize=2)
+def _background(ring):
+    """Rasterize the shared teal disk (with the dark inner circle if ring) once"""
+    size = MASTER_SIZE
+    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    margin = 10
+    box = [margin, margin, size - margin, size - margin]
     
-    for size in sizes:
-        img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
-        
-        scale = size / 256
-        margin = int(10 * scale)
-        
+    if ring:
+        # Dark inner circle inside a teal ring, drawn as one outlined ellipse
+        # so the centre is not painted teal first and then overdrawn
+        inner_margin = 25
+        draw.ellipse(box, fill='#1e1e2e', outline='#00d9a5', width=inner_margin - margin)
+    else:
         # Background circle
-        draw.ellipse(
-            [margin, margin, size - margin, size - margin],
-            fill='#00d9a5'
-        )
-        
-        # Inner circle
-        inner_margin = int(25 * scale)
-        draw.ellipse(
-            [inner_margin, inner_margin, size - inner_margin, size - inner_margin],
-            fill='#1e1e2e'
-        )
-        
-        # Draw music note (beamed eighth notes)
-        note_color = '#00d9a5'
-        cx = size // 2
-        cy = size // 2
-        
-        # Note heads
-        head_size = int(16 * scale)
-        head1_x = cx - int(20 * scale)
-        head1_y = cy + int(15 * scale)
-        head2_x = cx + int(20 * scale)
-        head2_y = cy + int(5 * scale)
-        
-        draw.ellipse([head1_x - head_size//2, head1_y - head_size//2,
-                      head1_x + head_size//2, head1_y + head_size//2], fill=note_color)
-        draw.ellipse([head2_x - head_size//2, head2_y - head_size//2,
-                      head2_x + head_size//2, head2_y + head_size//2], fill=note_color)
-        
-        # Stems
-        stem_width = max(2, int(4 * scale))
-        stem_height = int(50 * scale)
-        draw.rectangle([head1_x, head1_y - stem_height, head1_x + stem_width, head1_y], fill=note_color)
-        draw.rectangle([head2_x, head2_y - stem_height, head2_x + stem_width, head2_y], fill=note_color)
-        
-        # Beam
-        beam_height = int(8 * scale)
-        draw.rectangle([head1_x, head1_y - stem_height, head2_x + stem_width, head1_y - stem_height + beam_height], fill=note_color)
-        
-        images.append(img)
+        draw.ellipse(box, fill='#00d9a5')
+    return img
+
+
+def _save_icon(master, out_stem):
+    """Write out_stem.ico (all SIZES) and out_stem.png (master) to ICON_DIR"""
+    images = _downsample(master)
+    images[0].save(ICON_DIR / f"{out_stem}.ico", format='ICO', sizes=[(s, s) for s in SIZES], append_images=images[1:])
+    images[0].save(ICON_DIR / f"{out_stem}.png", format='PNG')
+
+
+def _build(overlay, out_stem, ring=False):
+    """Draw overlay onto a copy of the background disk and save it as out_stem"""
+    img = _background(ring).copy()
+    overlay(ImageDraw.Draw(img), MASTER_SIZE)
+    _save_icon(img, out_stem)
+
+
+def _draw_music(draw, size):
+    """Draw beamed eighth notes"""
+    note_color = '#00d9a5'
+    cx = size // 2
+    cy = size // 2
     
-    images[0].save(ICON_ICO, format='ICO', sizes=[(s, s) for s in sizes], append_images=images[1:])
-    images[0].save(ICON_PNG, format='PNG')
-    print("Music note icon created!")
+    # Note heads
+    head_size = 16
+    head1_x = cx - 20
+    head1_y = cy + 15
+    head2_x = cx + 20
+    head2_y = cy + 5
+    
+    draw.ellipse([head1_x - head_size//2, head1_y - head_size//2,
+                  head1_x + head_size//2, head1_y + head_size//2], fill=note_color)
+    draw.ellipse([head2_x - head_size//2, head2_y - head_size//2,
+                  head2_x + head_size//2, head2_y + head_size//2], fill=note_color)
+    
+    # Stems
+    stem_width = 4
+    stem_height = 50
+    draw.rectangle([head1_x, head1_y - stem_height, head1_x + stem_width, head1_y], fill=note_color)
+    draw.rectangle([head2_x, head2_y - stem_height, head2_x + stem_width, head2_y], fill=note_color)
+    
+    # Beam
+    beam_height = 8
+    draw.rectangle([head1_x, head1_y - stem_height, head2_x + stem_width, head1_y - stem_height + beam_height], fill=note_color)
 
-def create_r_icon():
-    """Create letter R icon"""
-    sizes = [256, 128, 64, 48, 32, 16]
-    images = []
+def _draw_r(draw, size):
+    """Draw a centred letter R"""
+    font = _get_font(140)
     
-    for size in sizes:
-        img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
-        
-        scale = size / 256
-        margin = int(10 * scale)
-        
-        draw.ellipse([margin, margin, size - margin, size - margin], fill='#00d9a5')
-        
-        # Letter R
-        try:
-            font = ImageFont.truetype("arialbd.ttf", int(140 * scale))
-        except:
-            try:
-                font = ImageFont.truetype("arial.ttf", int(140 * scale))
-            except:
-                font = ImageFont.load_default()
-        
-        text = "R"
-        bbox = draw.textbbox((0, 0), text, font=font)
-        x = (size - (bbox[2] - bbox[0])) // 2
-        y = (size - (bbox[3] - bbox[1])) // 2
-        draw.text((x, y), text, fill='#000000', font=font)
-        
-        images.append(img)
+    text = "R"
+    bbox = draw.textbbox((0, 0), text, font=font)
+    x = (size - (bbox[2] - bbox[0])) // 2
+    y = (size - (bbox[3] - bbox[1])) // 2
+    draw.text((x, y), text, fill='#000000', font=font)
+
+def _draw_arrow(draw, size):
+    """Draw a downward arrow"""
+    cx = size // 2
+    cy = size // 2
+    arrow_color = '#000000'
     
-    images[0].save(ICON_ICO, format='ICO', sizes=[(s, s) for s in sizes], append_images=images[1:])
-    images[0].save(ICON_PNG, format='PNG')
+    # Arrow shaft
+    draw.line([(cx, cy - 40), (cx, cy + 20)], fill=arrow_color, width=12)
+    
+    # Arrow head
+    head_size = 25
+    draw.polygon([
+        (cx - head_size, cy + 10),
+        (cx + head_size, cy + 10),
+        (cx, cy + 40)
+    ], fill=arrow_color)
+
+
+def create_music_icon(out_stem=ICON_STEM):
+    """Create music note icon drawn as shapes"""
+    _build(_draw_music, out_stem, ring=True)
+    print("Music note icon created!")
+
+def create_r_icon(out_stem=ICON_STEM):
+    """Create letter R icon"""
+    _build(_draw_r, out_stem)
     print("Letter R icon created!")
 
-def create_arrow_icon():
+def create_arrow_icon(out_stem=ICON_STEM):
     """Create download arrow icon"""
-    sizes = [256, 128, 64, 48, 32, 16]
-    images = []
-    
-    for size in sizes:
-        img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
-        
-        scale = size / 256
-        margin = int(10 * scale)
-        
-        draw.ellipse([margin, margin, size - margin, size - margin], fill='#00d9a5')
-        
-        cx = size // 2
-        cy = size // 2
-        arrow_color = '#000000'
-        
-        # Arrow shaft
-        line_width = max(3, int(12 * scale))
-        draw.line([(cx, cy - int(40 * scale)), (cx, cy + int(20 * scale))], fill=arrow_color, width=line_width)
-        
-        # Arrow head
-        head_size = int(25 * scale)
-        draw.polygon([
-            (cx - head_size, cy + int(10 * scale)),
-            (cx + head_size, cy + int(10 * scale)),
-            (cx, cy + int(40 * scale))
-        ], fill=arrow_color)
-        
-        images.append(img)
-    
-    images[0].save(ICON_ICO, format='ICO', sizes=[(s, s) for s in sizes], append_images=images[1:])
-    images[0].save(ICON_PNG, format='PNG')
+    _build(_draw_arrow, out_stem)
     print("Download arrow icon created!")
 
+STYLES = {
+    "1": ("music", create_music_icon),
+    "2": ("r", create_r_icon),
+    "3": ("arrow", create_arrow_icon),
+}
+
+
 if __name__ == '__main__':
     # Get style from command line argument or default to music note
     if len(sys.argv) > 1:
@@ -155,17 +160,18 @@ if __name__ == '__main__':
     else:
         choice = "1"
     
-    if choice == "1":
-        create_music_icon()
-    elif choice == "2":
-        create_r_icon()
-    elif choice == "3":
-        create_arrow_icon()
+    if choice in STYLES:
+        STYLES[choice][1]()
+    elif choice == "all":
+        # One interpreter and one Pillow import for the whole set
+        for name, create in STYLES.values():
+            create(out_stem=f"{ICON_STEM}_{name}")
     else:
-        print("Usage: python tools/icons/create_icon.py [1|2|3]")
+        print("Usage: python tools/icons/create_icon.py [1|2|3|all]")
         print("  1 = Music note (default)")
         print("  2 = Letter R")
         print("  3 = Download arrow")
+        print("  all = All styles (icon_music, icon_r, icon_arrow)")
         print()
         print("Creating music note icon...")
         create_music_icon()